@@ -176,6 +176,7 @@ def demo_database_operations():
     print(f"✅ Retrieved {len(all_diagrams)} diagrams from database")
     
     # Cleanup
+    db_manager.close()
     os.unlink(db_path)
 
 def demo_ai_prompts():
@@ -0,0 +1,70 @@
+// Headless SVG renderer for D3-Mind-Flow-Editor exports
+// Reads a standalone diagram HTML document on stdin, runs its D3 scripts
+// inside jsdom and writes the first rendered <svg> element to stdout.
+//
+// Usage: node render_svg.mjs [width] [height]  (viewport in CSS pixels)
+// Requires: npm install --prefix src/assets/node  (jsdom, see package.json)
+// Exit codes: 0 = SVG written, 1 = no SVG rendered, 2 = jsdom unavailable,
+//             3 = template never signalled window.__d3_ready or reported
+//                 window.__d3_error
+
+const READY_TIMEOUT_MS = 10000;
+const POLL_MS = 50;
+
+// jsdom reports a fixed 1024x768 window unless told otherwise
+const viewportWidth = Number(process.argv[2]) || 1024;
+const viewportHeight = Number(process.argv[3]) || 768;
+
+let JSDOM;
+try {
+    ({ JSDOM } = await import('jsdom'));
+} catch (e) {
+    process.stderr.write(`jsdom is not installed (run npm install in this directory): ${e.message}\n`);
+    process.exit(2);
+}
+
+const chunks = [];
+for await (const chunk of process.stdin) {
+    chunks.push(chunk);
+}
+const html = Buffer.concat(chunks).toString('utf-8');
+
+const dom = new JSDOM(html, {
+    runScripts: 'dangerously',
+    resources: 'usable',
+    pretendToBeVisual: true,
+    beforeParse(window) {
+        for (const [name, value] of [
+            ['innerWidth', viewportWidth], ['outerWidth', viewportWidth],
+            ['innerHeight', viewportHeight], ['outerHeight', viewportHeight]
+        ]) {
+            Object.defineProperty(window, name, { value, configurable: true });
+        }
+    }
+});
+
+await new Promise((resolve) => dom.window.addEventListener('load', resolve));
+// Wait for the template to signal that D3 has finished rendering
+for (let waited = 0; !dom.window.__d3_ready && waited < READY_TIMEOUT_MS; waited += POLL_MS) {
+    await new Promise((resolve) => setTimeout(resolve, POLL_MS));
+}
+
+// Templates ship a static empty <svg>, so without the flag the first
+// <svg> is not the diagram
+if (dom.window.__d3_ready !== true) {
+    process.stderr.write('Template did not signal window.__d3_ready\n');
+    process.exit(3);
+}
+if (dom.window.__d3_error) {
+    process.stderr.write(`Template reported an error: ${dom.window.__d3_error}\n`);
+    process.exit(3);
+}
+
+const svg = dom.window.document.querySelector('svg');
+if (!svg) {
+    process.stderr.write('No SVG element rendered\n');
+    process.exit(1);
+}
+
+process.stdout.write(new dom.window.XMLSerializer().serializeToString(svg));
+dom.window.close();
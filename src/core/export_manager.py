@@ -5,19 +5,147 @@ Handles HTML, PNG, SVG, and PDF export with high-resolution support using Playwr
 """
 
 import os
+import re
 import json
+import hashlib
+import itertools
+import base64
+import shutil
+import struct
+import zlib
 import asyncio
 from pathlib import Path
-from typing import Dict, Optional, Tuple
-from playwright.async_api import async_playwright
-from PIL import Image
-import tempfile
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):
+    # OSError: the package is installed but the cairo library is missing
+    cairosvg = None
 
 from ..utils.config import Config
 from ..utils.logger import logger
 from ..utils.resolution_manager import ResolutionManager
 
 
+# Export format specifications from design document (read-only, shared)
+SUPPORTED_FORMATS = MappingProxyType({
+    'html': 'スタンドアロンHTML（推奨：マインドマップ）',
+    'png': '高解像度PNG（推奨：フローチャート）',
+    'svg': 'ベクターSVG（拡大縮小対応）',
+    'pdf': 'ベクターPDF（印刷用）',
+    'webp': 'WebP（軽量ラスター）'
+})
+
+# Recommended export settings per use case (read-only, shared)
+RECOMMENDED_SETTINGS = MappingProxyType({
+    'web': MappingProxyType({
+        'png_dpi': 72,
+        'png_width': 1920,
+        'png_height': 1080,
+        'pdf_paper_size': 'A4'
+    }),
+    'presentation': MappingProxyType({
+        'png_dpi': 150,
+        'png_width': 1920,
+        'png_height': 1080,
+        'pdf_paper_size': 'A4'
+    }),
+    'print': MappingProxyType({
+        'png_dpi': 300,
+        'png_width': 3840,
+        'png_height': 2160,
+        'pdf_paper_size': 'A3'
+    })
+})
+
+# PDF paper sizes in inches
+PAPER_SIZES = MappingProxyType({
+    'A4': {'width': 8.27, 'height': 11.69},
+    'A3': {'width': 11.69, 'height': 16.54},
+    'Letter': {'width': 8.5, 'height': 11}
+})
+
+# Chromium flags for headless export: skip GPU init, extensions,
+# background networking and other subsystems a static render never uses
+LAUNCH_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-translate',
+    '--disable-sync',
+    '--hide-scrollbars',
+    '--mute-audio'
+]
+
+# Node.js + jsdom script used to render SVG exports without Chromium
+NODE_SVG_RENDERER = Path(__file__).parent.parent / 'assets' / 'node' / 'render_svg.mjs'
+NODE_RENDER_TIMEOUT = 30
+# render_svg.mjs exit status when jsdom is not installed
+NODE_RENDER_NO_JSDOM = 2
+
+# Seconds to wait for Chromium/Playwright to shut down before giving up
+BROWSER_CLOSE_TIMEOUT = 5
+
+# How long to wait for a template to set window.__d3_ready after loading
+READY_TIMEOUT_MS = 10000
+
+# Number of generated HTML documents kept for reuse across formats
+HTML_CACHE_SIZE = 16
+
+# Limits of the on-disk export cache; least recently used entries are
+# evicted beyond either (high-DPI PNG/PDF entries can be tens of MB)
+EXPORT_CACHE_MAX_ENTRIES = 64
+EXPORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Default number of warm Chromium pages kept per diagram type
+# (overridable via export.page_pool_size)
+PAGE_POOL_SIZE = 4
+
+# Fallback page used when a diagram template is missing or fails; split once
+# at import so each call is a plain join
+FALLBACK_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{TYPE_TITLE} Export</title>
+    <script src="https://d3js.org/d3.v7.min.js"></script>
+    <style>
+        body {
+            margin: 0;
+            padding: 20px;
+            font-family: 'Segoe UI', 'Hiragino Sans', 'Yu Gothic UI', sans-serif;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>{TYPE_TITLE} Export</h1>
+        <div id="diagram"></div>
+        <pre>{CONTENT}</pre>
+    </div>
+    <script>window.__d3_ready = true;</script>
+</body>
+</html>
+        """
+_FALLBACK_PARTS = tuple(re.split(r'\{TYPE_TITLE\}|\{CONTENT\}', FALLBACK_HTML))
+
+
 class ExportManager:
     """Manages export functionality for all diagram formats"""
     
@@ -26,13 +154,44 @@ class ExportManager:
         self.resolution_manager = resolution_manager
         
         # Export format specifications from design document
-        self.supported_formats = {
-            'html': 'スタンドアロンHTML（推奨：マインドマップ）',
-            'png': '高解像度PNG（推奨：フローチャート）', 
-            'svg': 'ベクターSVG（拡大縮小対応）',
-            'pdf': 'ベクターPDF（印刷用）'
+        self.supported_formats = SUPPORTED_FORMATS
+        
+        # Pre-split templates keyed by diagram type (see _get_template_parts)
+        self.template_cache = {}
+        
+        # Recently generated HTML keyed by (type, content, styles)
+        self.html_cache = OrderedDict()
+        
+        # Shared headless browser and warm pages per diagram type
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self._page_pools = {}
+        self._page_counts = {}
+        self._cdp_sessions = {}
+        
+        # Cleared once Node.js or jsdom turns out to be missing, so later
+        # SVG exports go straight to Chromium
+        self._node_renderer_available = True
+        
+        # Browser-rendered formats, dispatched by export_diagram
+        self._exporters = {
+            'png': self._export_png,
+            'webp': self._export_webp,
+            'svg': self._export_svg,
+            'pdf': self._export_pdf
         }
         
+        # Content-addressed cache of rendered exports, private to the user;
+        # created on first store (see _store_in_cache)
+        self.cache_dir = Path.home() / '.d3_mind_flow_editor' / 'export_cache'
+        # Monotonic suffix for cache staging files
+        self._tmp_counter = itertools.count()
+        
+        # Resolved PNG settings, recomputed only when the config changes
+        self._png_settings = None
+        self._png_settings_revision = None
+        
         logger.debug("Export manager initialized")
     
     async def export_diagram(self, diagram_data: Dict, format: str, output_path: str) -> bool:
@@ -41,7 +200,7 @@ class ExportManager:
         
         Args:
             diagram_data: Diagram data with type, content, styles
-            format: Export format (html/png/svg/pdf)
+            format: Export format (html/png/webp/svg/pdf)
             output_path: Output file path
             
         Returns:
@@ -49,23 +208,254 @@ class ExportManager:
         """
         try:
             # Generate HTML content
-            html_content = self._generate_standalone_html(diagram_data)
+            html_content = await self._get_html(diagram_data)
+            
+            diagram_type = diagram_data.get('type', 'mindmap')
             
             if format == 'html':
                 return await self._export_html(html_content, output_path)
-            elif format == 'png':
-                return await self._export_png(html_content, output_path)
-            elif format == 'svg':
-                return await self._export_svg(html_content, output_path)
-            elif format == 'pdf':
-                return await self._export_pdf(html_content, output_path)
-            else:
+            
+            exporter = self._exporters.get(format)
+            if exporter is None:
                 raise ValueError(f"Unsupported format: {format}")
+            
+            # Rendered formats: reuse an identical earlier export if cached
+            cache_path = self._get_cache_path(html_content, format)
+            if await asyncio.to_thread(self._restore_from_cache, cache_path, output_path):
+                logger.info(f"{format.upper()} exported from cache: {output_path}")
+                return True
+            
+            # Cleared by _rendered_page when D3 did not finish rendering
+            render_state = {'complete': True}
+            success = await exporter(html_content, output_path, diagram_type, render_state)
+            
+            if success and render_state['complete']:
+                await asyncio.to_thread(self._store_in_cache, output_path, cache_path)
+            return success
                 
         except Exception as e:
             logger.error(f"Export failed: {e}")
             return False
     
+    def _get_cache_path(self, html_content: str, format: str) -> Path:
+        """
+        Get the export cache file for a rendered diagram
+        
+        The key hashes the generated HTML (template + data), the format and
+        all export settings, so any change to them misses the cache.
+        """
+        settings = json.dumps(self.get_export_settings(), sort_keys=True)
+        digest = hashlib.sha256()
+        for part in (html_content, format, settings):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return self.cache_dir / f"{digest.hexdigest()}.{format}"
+    
+    @staticmethod
+    def _restore_from_cache(cache_path: Path, output_path: str) -> bool:
+        """Copy a cached export to output_path; False on a cache miss"""
+        try:
+            shutil.copyfile(cache_path, output_path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Export cache read failed: {e}")
+            return False
+        
+        # Refresh mtime so pruning evicts least recently used entries first
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return True
+    
+    def _store_in_cache(self, output_path: str, cache_path: Path):
+        """
+        Copy a finished export into the cache and prune old entries
+        
+        The cache is optional: any filesystem error (e.g. a read-only home
+        directory) is logged and the export itself is unaffected.
+        """
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            
+            # Unique per store: concurrent exports may target the same entry
+            temp_path = cache_path.with_name(
+                f"{cache_path.name}.{os.getpid()}.{next(self._tmp_counter)}.tmp"
+            )
+            shutil.copyfile(output_path, temp_path)
+            os.replace(temp_path, cache_path)
+            
+            # Keep the newest entries within both the count and byte limits
+            entries = sorted(
+                ((entry.stat(), entry) for entry in self.cache_dir.iterdir()),
+                key=lambda item: item[0].st_mtime, reverse=True
+            )
+            total_bytes = 0
+            for index, (stat, entry) in enumerate(entries):
+                total_bytes += stat.st_size
+                if index >= EXPORT_CACHE_MAX_ENTRIES or total_bytes > EXPORT_CACHE_MAX_BYTES:
+                    entry.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Export cache write failed: {e}")
+    
+    async def export_diagrams_batch(self, jobs: List[Dict]) -> List[bool]:
+        """
+        Export many diagrams concurrently on the shared browser
+        
+        Jobs share one Chromium launch. At most export.page_pool_size
+        groups run at once, which bounds Node.js renders, HTML generation
+        and file writes as well as browser pages. Jobs that export the same
+        diagram to different formats are grouped and rendered once through
+        export_multi.
+        
+        Args:
+            jobs: Dicts with 'diagram_data', 'format' and 'output_path' keys
+            
+        Returns:
+            Success flag per job, in job order
+        """
+        limit = asyncio.Semaphore(self.config.get('export.page_pool_size', PAGE_POOL_SIZE))
+        
+        async def get_html(job: Dict) -> str:
+            async with limit:
+                return await self._get_html(job['diagram_data'])
+        
+        html_contents = await asyncio.gather(
+            *(get_html(job) for job in jobs),
+            return_exceptions=True
+        )
+        
+        # Each group holds job indices for one diagram, at most one per format
+        groups: List[Dict[str, int]] = []
+        groups_by_html: Dict[str, List[Dict[str, int]]] = {}
+        for index, (job, html_content) in enumerate(zip(jobs, html_contents)):
+            if isinstance(html_content, Exception):
+                groups.append({job['format']: index})
+                continue
+            candidates = groups_by_html.setdefault(html_content, [])
+            group = next((g for g in candidates if job['format'] not in g), None)
+            if group is None:
+                group = {}
+                candidates.append(group)
+                groups.append(group)
+            group[job['format']] = index
+        
+        async def run_group(group: Dict[str, int]) -> Dict[str, bool]:
+            async with limit:
+                if len(group) == 1:
+                    (fmt, index), = group.items()
+                    job = jobs[index]
+                    return {fmt: await self.export_diagram(job['diagram_data'], fmt, job['output_path'])}
+                diagram_data = jobs[next(iter(group.values()))]['diagram_data']
+                return await self.export_multi(
+                    diagram_data, {fmt: jobs[index]['output_path'] for fmt, index in group.items()}
+                )
+        
+        results = [False] * len(jobs)
+        group_results = await asyncio.gather(*(run_group(group) for group in groups))
+        for group, group_result in zip(groups, group_results):
+            for fmt, index in group.items():
+                results[index] = group_result.get(fmt, False)
+        return results
+    
+    async def export_multi(self, diagram_data: Dict, outputs: Dict[str, str]) -> Dict[str, bool]:
+        """
+        Export one diagram to several formats from a single render
+        
+        The HTML is generated once and the diagram is rendered on one pooled
+        page; every browser-based format is then captured from that page.
+        Formats found in the export cache are restored without rendering.
+        
+        Args:
+            diagram_data: Diagram data with type, content, styles
+            outputs: Mapping of export format to output file path
+            
+        Returns:
+            Mapping of export format to success flag
+        """
+        results = {fmt: False for fmt in outputs}
+        
+        try:
+            html_content = await self._get_html(diagram_data)
+            diagram_type = diagram_data.get('type', 'mindmap')
+            
+            if 'html' in outputs:
+                results['html'] = await self._export_html(html_content, outputs['html'])
+            
+            page_formats = {fmt: path for fmt, path in outputs.items()
+                            if fmt in self._exporters}
+            for fmt in outputs:
+                if fmt != 'html' and fmt not in page_formats:
+                    logger.error(f"Unsupported format: {fmt}")
+            
+            # Reuse identical earlier exports; only the misses need a render
+            cache_paths = {fmt: self._get_cache_path(html_content, fmt) for fmt in page_formats}
+            for fmt in list(page_formats):
+                if await asyncio.to_thread(self._restore_from_cache, cache_paths[fmt], page_formats[fmt]):
+                    logger.info(f"{fmt.upper()} exported from cache: {page_formats[fmt]}")
+                    results[fmt] = True
+                    del page_formats[fmt]
+            if not page_formats:
+                return results
+            
+            render_state = {'complete': True}
+            async with self._rendered_page(html_content, diagram_type, render_state) as page:
+                # Screen captures and SVG extraction can share the page
+                # concurrently; PDF switches the page to print media, so it
+                # runs after they finish
+                captures = [fmt for fmt in page_formats if fmt != 'pdf']
+                captured = await asyncio.gather(
+                    *(self._emit_from_page(page, fmt, page_formats[fmt]) for fmt in captures),
+                    return_exceptions=True
+                )
+                for fmt, result in zip(captures, captured):
+                    if isinstance(result, Exception):
+                        logger.error(f"{fmt.upper()} export failed: {result}")
+                    else:
+                        results[fmt] = result
+                
+                if 'pdf' in page_formats:
+                    try:
+                        results['pdf'] = await self._write_pdf(page, page_formats['pdf'])
+                    except Exception as e:
+                        logger.error(f"PDF export failed: {e}")
+            
+            for fmt, output_path in page_formats.items():
+                if results[fmt] and render_state['complete']:
+                    await asyncio.to_thread(self._store_in_cache, output_path, cache_paths[fmt])
+            
+        except Exception as e:
+            logger.error(f"Multi-format export failed: {e}")
+        
+        return results
+    
+    async def _get_html(self, diagram_data: Dict) -> str:
+        """
+        Get standalone HTML for a diagram, memoized per session
+        
+        Exporting one diagram to several formats generates its HTML once.
+        Generation runs off the event loop so other exports' browser I/O
+        can proceed meanwhile.
+        """
+        key = (
+            diagram_data.get('type', 'mindmap'),
+            diagram_data.get('content', ''),
+            json.dumps(diagram_data.get('styles', {}), sort_keys=True, default=str)
+        )
+        
+        html_content = self.html_cache.get(key)
+        if html_content is not None:
+            self.html_cache.move_to_end(key)
+            return html_content
+        
+        html_content = await asyncio.to_thread(self._generate_standalone_html, diagram_data)
+        
+        self.html_cache[key] = html_content
+        if len(self.html_cache) > HTML_CACHE_SIZE:
+            self.html_cache.popitem(last=False)
+        return html_content
+    
     def _generate_standalone_html(self, diagram_data: Dict) -> str:
         """
         Generate standalone HTML with embedded D3.js templates
@@ -80,70 +470,79 @@ class ExportManager:
         content = diagram_data.get('content', '')
         styles = diagram_data.get('styles', {})
         
-        # Load appropriate D3.js template
-        template_path = Path(__file__).parent.parent / 'assets' / 'd3_templates' / f'{diagram_type}.html'
-        
-        if not template_path.exists():
-            logger.error(f"Template not found: {template_path}")
-            # Fallback to basic template
-            return self._generate_fallback_html(diagram_data)
-        
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template = f.read()
+            template_parts = self._get_template_parts(diagram_type)
+            if template_parts is None:
+                # Fallback to basic template
+                return self._generate_fallback_html(diagram_data)
             
-            # Embed data into template
-            data_json = json.dumps({
+            # Embed data into template (orjson when available, escaping
+            # "</" so the payload cannot close the surrounding <script>)
+            payload = {
                 'content': content,
                 'styles': styles,
                 'type': diagram_type
-            }, ensure_ascii=False)
-            
-            # Replace placeholder with actual data
-            html_content = template.replace('{{DIAGRAM_DATA}}', data_json)
-            
-            # Make standalone (embed D3.js CDN content)
-            html_content = self._make_standalone(html_content)
+            }
+            data_json = None
+            if orjson is not None:
+                try:
+                    data_json = orjson.dumps(payload).decode('utf-8')
+                except orjson.JSONEncodeError:
+                    # e.g. non-str keys in styles or ints wider than 64 bits,
+                    # which json accepts
+                    pass
+            if data_json is None:
+                data_json = json.dumps(payload, ensure_ascii=False)
+            data_json = data_json.replace('</', '<\\/')
             
-            return html_content
+            # Template is pre-split at every placeholder, so a single join
+            # produces the final document
+            return data_json.join(template_parts)
             
         except Exception as e:
             logger.error(f"Template processing failed: {e}")
             return self._generate_fallback_html(diagram_data)
     
+    def _get_template_parts(self, diagram_type: str) -> Optional[Tuple[str, ...]]:
+        """
+        Load a D3.js template, made standalone and split at {{DIAGRAM_DATA}}
+        
+        Args:
+            diagram_type: Diagram type (template file name)
+            
+        Returns:
+            Template pieces to join with the data JSON, or None if missing
+        """
+        if diagram_type in self.template_cache:
+            return self.template_cache[diagram_type]
+        
+        # Load appropriate D3.js template
+        template_path = Path(__file__).parent.parent / 'assets' / 'd3_templates' / f'{diagram_type}.html'
+        
+        if not template_path.exists():
+            logger.error(f"Template not found: {template_path}")
+            return None
+        
+        with open(template_path, 'r', encoding='utf-8') as f:
+            template = f.read()
+        
+        # Make standalone (embed D3.js CDN content) once, before the data
+        # is spliced in
+        template = self._make_standalone(template)
+        
+        template_parts = tuple(template.split('{{DIAGRAM_DATA}}'))
+        self.template_cache[diagram_type] = template_parts
+        return template_parts
+    
     def _generate_fallback_html(self, diagram_data: Dict) -> str:
         """Generate basic fallback HTML when template fails"""
         diagram_type = diagram_data.get('type', 'mindmap')
         content = diagram_data.get('content', '')
         
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{diagram_type.title()} Export</title>
-    <script src="https://d3js.org/d3.v7.min.js"></script>
-    <style>
-        body {{
-            margin: 0;
-            padding: 20px;
-            font-family: 'Segoe UI', 'Hiragino Sans', 'Yu Gothic UI', sans-serif;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>{diagram_type.title()} Export</h1>
-        <div id="diagram"></div>
-        <pre>{content}</pre>
-    </div>
-</body>
-</html>
-        """
+        type_title = diagram_type.title()
+        head, title_to_heading, heading_to_content, tail = _FALLBACK_PARTS
+        return ''.join((head, type_title, title_to_heading, type_title,
+                        heading_to_content, content, tail))
     
     def _make_standalone(self, html_content: str) -> str:
         """
@@ -165,11 +564,20 @@ class ExportManager:
         
         return html_content.replace('<head>', f'<head>\n{standalone_note}')
     
+    @staticmethod
+    def _write_file(output_path: str, data) -> None:
+        """Write text or bytes to disk (run via asyncio.to_thread off the event loop)"""
+        if isinstance(data, bytes):
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+    
     async def _export_html(self, html_content: str, output_path: str) -> bool:
         """Export as standalone HTML file"""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            await asyncio.to_thread(self._write_file, output_path, html_content)
             
             logger.info(f"HTML exported successfully: {output_path}")
             return True
@@ -178,191 +586,551 @@ class ExportManager:
             logger.error(f"HTML export failed: {e}")
             return False
     
-    async def _export_png(self, html_content: str, output_path: str) -> bool:
+    async def _export_png(self, html_content: str, output_path: str,
+                          diagram_type: str = 'mindmap',
+                          render_state: Optional[Dict] = None) -> bool:
         """
         Export as high-resolution PNG using Playwright
         Based on design document specifications
         """
         try:
-            # Get export settings from config
-            png_dpi = self.config.get('export.png_dpi', 300)
-            png_width = self.config.get('export.png_width', 1920)
-            png_height = self.config.get('export.png_height', 1080)
-            
-            # Calculate scale factor: scale = dpi / 72
-            scale_factor = png_dpi / 72.0
-            
-            # Adjust viewport for high resolution
-            viewport_width = int(png_width * scale_factor)
-            viewport_height = int(png_height * scale_factor)
-            
-            # Create temporary HTML file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(html_content)
-                temp_html_path = f.name
-            
-            try:
-                async with async_playwright() as p:
-                    # Launch browser with high DPI support
-                    browser = await p.chromium.launch(headless=True)
-                    
-                    # Create page with high resolution viewport
-                    page = await browser.new_page(
-                        viewport={'width': viewport_width, 'height': viewport_height},
-                        device_scale_factor=scale_factor
-                    )
-                    
-                    # Navigate to HTML file
-                    await page.goto(f'file://{temp_html_path}')
-                    
-                    # Wait for D3.js to render
-                    await page.wait_for_load_state('networkidle')
-                    await asyncio.sleep(2)  # Additional wait for D3 animations
-                    
-                    # Take screenshot
-                    await page.screenshot(
-                        path=output_path,
-                        full_page=False,
-                        scale='device'
-                    )
-                    
-                    await browser.close()
-                
-                # Set PNG DPI metadata using Pillow
-                self._set_png_dpi(output_path, png_dpi)
-                
-                logger.info(f"PNG exported successfully: {output_path} (DPI: {png_dpi})")
-                return True
-                
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_html_path)
+            async with self._rendered_page(html_content, diagram_type, render_state) as page:
+                return await self._write_png(page, output_path)
                 
         except Exception as e:
             logger.error(f"PNG export failed: {e}")
             return False
     
-    def _set_png_dpi(self, png_path: str, dpi: int):
-        """Set DPI metadata in PNG file using Pillow"""
+    async def _export_webp(self, html_content: str, output_path: str,
+                           diagram_type: str = 'mindmap',
+                           render_state: Optional[Dict] = None) -> bool:
+        """Export as WebP, a smaller raster alternative to PNG"""
         try:
-            with Image.open(png_path) as img:
-                img.save(png_path, dpi=(dpi, dpi))
-            logger.debug(f"PNG DPI metadata set to {dpi}")
+            async with self._rendered_page(html_content, diagram_type, render_state) as page:
+                return await self._write_webp(page, output_path)
+                
         except Exception as e:
-            logger.warning(f"Failed to set PNG DPI metadata: {e}")
+            logger.error(f"WebP export failed: {e}")
+            return False
     
-    async def _export_svg(self, html_content: str, output_path: str) -> bool:
+    async def _export_svg(self, html_content: str, output_path: str,
+                          diagram_type: str = 'mindmap',
+                          render_state: Optional[Dict] = None) -> bool:
         """
         Export as SVG by extracting SVG from D3.js rendered page
+        
+        Tries the lightweight Node.js/jsdom renderer first and only starts
+        Chromium when that is unavailable or fails.
         """
         try:
-            # Create temporary HTML file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(html_content)
-                temp_html_path = f.name
+            svg_content = await self._render_svg_with_node(html_content)
+            if svg_content is None:
+                async with self._rendered_page(html_content, diagram_type, render_state) as page:
+                    svg_content = await self._extract_svg(page)
             
-            try:
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
-                    page = await browser.new_page()
-                    
-                    await page.goto(f'file://{temp_html_path}')
-                    await page.wait_for_load_state('networkidle')
-                    await asyncio.sleep(2)
-                    
-                    # Extract SVG content using JavaScript
-                    svg_content = await page.evaluate("""
-                        () => {
-                            const svgs = document.querySelectorAll('svg');
-                            if (svgs.length > 0) {
-                                return svgs[0].outerHTML;
-                            }
-                            return null;
-                        }
-                    """)
-                    
-                    await browser.close()
-                
-                if svg_content:
-                    # Add XML declaration and clean up SVG
-                    svg_content = '<?xml version="1.0" encoding="UTF-8"?>\\n' + svg_content
-                    
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(svg_content)
-                    
-                    logger.info(f"SVG exported successfully: {output_path}")
-                    return True
-                else:
-                    logger.error("No SVG content found in rendered page")
-                    return False
-                
-            finally:
-                os.unlink(temp_html_path)
+            return await self._write_svg(svg_content, output_path)
                 
         except Exception as e:
             logger.error(f"SVG export failed: {e}")
             return False
     
-    async def _export_pdf(self, html_content: str, output_path: str) -> bool:
+    async def _export_pdf(self, html_content: str, output_path: str,
+                          diagram_type: str = 'mindmap',
+                          render_state: Optional[Dict] = None) -> bool:
         """
         Export as vector PDF using Playwright
         Based on design document: prefer vector format
+        
+        With export.pdf_cairosvg on and cairosvg available, the SVG from the
+        Node.js renderer is converted directly and Chromium is only started
+        as a fallback. Off by default: cairosvg only sees the bare <svg>, so
+        template CSS outside it (e.g. link strokes) is not applied.
         """
         try:
-            # Get PDF settings from config
-            pdf_vector = self.config.get('export.pdf_vector', True)
-            paper_size = self.config.get('export.pdf_paper_size', 'A4')
-            
-            # Paper size mapping
-            paper_sizes = {
-                'A4': {'width': 8.27, 'height': 11.69},  # inches
-                'A3': {'width': 11.69, 'height': 16.54},
-                'Letter': {'width': 8.5, 'height': 11}
-            }
-            
-            size_config = paper_sizes.get(paper_size, paper_sizes['A4'])
-            
-            # Create temporary HTML file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(html_content)
-                temp_html_path = f.name
+            if (cairosvg is not None and self.config.get('export.pdf_vector', True)
+                    and self.config.get('export.pdf_cairosvg', False)):
+                svg_content = await self._render_svg_with_node(html_content)
+                if svg_content is not None:
+                    await asyncio.to_thread(self._svg_to_pdf, svg_content, output_path)
+                    logger.info(f"PDF exported successfully: {output_path} (Vector: True, cairosvg)")
+                    return True
             
-            try:
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
-                    page = await browser.new_page()
-                    
-                    await page.goto(f'file://{temp_html_path}')
-                    await page.wait_for_load_state('networkidle')
-                    await asyncio.sleep(2)
-                    
-                    # Generate PDF with vector support
-                    if pdf_vector:
-                        await page.pdf(
-                            path=output_path,
-                            format=paper_size if paper_size in ['A3', 'A4', 'Letter'] else None,
-                            width=f"{size_config['width']}in" if paper_size not in ['A3', 'A4', 'Letter'] else None,
-                            height=f"{size_config['height']}in" if paper_size not in ['A3', 'A4', 'Letter'] else None,
-                            print_background=True,
-                            prefer_css_page_size=True
-                        )
-                    else:
-                        # Fallback: PNG to PDF conversion
-                        logger.warning("Vector PDF failed, using raster fallback")
-                        return False
-                    
-                    await browser.close()
-                
-                logger.info(f"PDF exported successfully: {output_path} (Vector: {pdf_vector})")
-                return True
-                
-            finally:
-                os.unlink(temp_html_path)
+            async with self._rendered_page(html_content, diagram_type, render_state) as page:
+                return await self._write_pdf(page, output_path)
                 
         except Exception as e:
             logger.error(f"PDF export failed: {e}")
             return False
     
+    async def _emit_from_page(self, page, format: str, output_path: str) -> bool:
+        """Write one export format from an already rendered page"""
+        if format == 'png':
+            return await self._write_png(page, output_path)
+        elif format == 'webp':
+            return await self._write_webp(page, output_path)
+        elif format == 'svg':
+            return await self._write_svg(await self._extract_svg(page), output_path)
+        elif format == 'pdf':
+            return await self._write_pdf(page, output_path)
+        raise ValueError(f"Unsupported format: {format}")
+    
+    @asynccontextmanager
+    async def _rendered_page(self, html_content: str, diagram_type: str,
+                             render_state: Optional[Dict] = None):
+        """
+        Rent a pooled page, load the diagram HTML and wait for D3 to render
+        
+        The page is yielded even when rendering did not finish, so the
+        export still gets written; render_state['complete'] is then set to
+        False so the result is kept out of the export cache.
+        """
+        pool, page = await self._acquire_page(diagram_type)
+        try:
+            # Inject the HTML directly; CDN scripts load fine from about:blank
+            await page.set_content(html_content, wait_until='load')
+            
+            # Wait for the template to signal that D3.js has rendered
+            try:
+                await page.wait_for_function(
+                    '() => window.__d3_ready === true', timeout=READY_TIMEOUT_MS
+                )
+                # Templates also set the flag after showing an error message
+                complete = not await page.evaluate('() => Boolean(window.__d3_error)')
+                if not complete:
+                    logger.debug("Template reported a render error")
+            except Exception as e:
+                logger.debug(f"Render readiness signal not received: {e}")
+                await page.wait_for_load_state('networkidle')
+                complete = False
+            
+            if render_state is not None and not complete:
+                render_state['complete'] = False
+            
+            yield page
+        finally:
+            await self._release_page(pool, page)
+    
+    async def _write_png(self, page, output_path: str) -> bool:
+        """Capture a rendered page as PNG with DPI metadata"""
+        png_dpi = self._get_png_settings()[0]
+        
+        # Take screenshot into memory
+        png_bytes = await self._capture_screenshot(page, {
+            'format': 'png', 'captureBeyondViewport': False
+        })
+        
+        # Stamp DPI metadata and write the file in a single pass
+        await asyncio.to_thread(
+            self._write_file, output_path, self._set_png_dpi(png_bytes, png_dpi)
+        )
+        
+        logger.info(f"PNG exported successfully: {output_path} (DPI: {png_dpi})")
+        return True
+    
+    async def _write_webp(self, page, output_path: str) -> bool:
+        """Capture a rendered page as WebP"""
+        webp_quality = self.config.get('export.webp_quality', 90)
+        
+        webp_bytes = await self._capture_screenshot(page, {
+            'format': 'webp', 'quality': webp_quality
+        })
+        
+        await asyncio.to_thread(self._write_file, output_path, webp_bytes)
+        
+        logger.info(f"WebP exported successfully: {output_path} (Quality: {webp_quality})")
+        return True
+    
+    async def _capture_screenshot(self, page, params: Dict) -> bytes:
+        """
+        Capture the viewport via the DevTools Page.captureScreenshot command
+        
+        Calls CDP directly over a session cached per page, skipping the
+        page.screenshot() wrapper; this also provides WebP, which
+        page.screenshot() cannot encode. Output is at device scale.
+        
+        Args:
+            page: Rendered page
+            params: Page.captureScreenshot parameters (format, quality, ...)
+            
+        Returns:
+            Encoded image bytes
+        """
+        cdp = self._cdp_sessions.get(page)
+        if cdp is None:
+            cdp = await page.context.new_cdp_session(page)
+            self._cdp_sessions[page] = cdp
+        
+        result = await cdp.send('Page.captureScreenshot', {'fromSurface': True, **params})
+        return base64.b64decode(result['data'])
+    
+    async def _extract_svg(self, page) -> Optional[str]:
+        """
+        Extract the first SVG element from a rendered page
+        
+        XMLSerializer yields namespace-correct XML, unlike outerHTML, which
+        serializes with HTML rules.
+        """
+        svg = page.locator('svg').first
+        if await svg.count() == 0:
+            return None
+        return await svg.evaluate('el => new XMLSerializer().serializeToString(el)')
+    
+    async def _write_svg(self, svg_content: Optional[str], output_path: str) -> bool:
+        """Write extracted SVG markup as a standalone SVG file"""
+        if not svg_content:
+            logger.error("No SVG content found in rendered page")
+            return False
+        
+        # Add XML declaration and clean up SVG
+        svg_content = '<?xml version="1.0" encoding="UTF-8"?>\n' + svg_content
+        
+        await asyncio.to_thread(self._write_file, output_path, svg_content)
+        
+        logger.info(f"SVG exported successfully: {output_path}")
+        return True
+    
+    async def _write_pdf(self, page, output_path: str) -> bool:
+        """
+        Print a rendered page to PDF
+        
+        Vector by default; with export.pdf_vector off, the page is captured
+        as PNG in memory and that image is printed instead.
+        """
+        # Get PDF settings from config
+        pdf_vector = self.config.get('export.pdf_vector', True)
+        paper_size = self.config.get('export.pdf_paper_size', 'A4')
+        
+        if not pdf_vector:
+            # Raster PDF: swap the page content for the screenshot, embedded
+            # as a data URI so the PNG never touches the filesystem
+            png_bytes = await self._capture_screenshot(page, {'format': 'png'})
+            png_data = base64.b64encode(png_bytes).decode('ascii')
+            await page.set_content(
+                '<!DOCTYPE html><html><body style="margin:0">'
+                f'<img src="data:image/png;base64,{png_data}" style="width:100%">'
+                '</body></html>'
+            )
+        
+        size_config = PAPER_SIZES.get(paper_size, PAPER_SIZES['A4'])
+        
+        # Generate PDF with vector support
+        await page.pdf(
+            path=output_path,
+            format=paper_size if paper_size in ['A3', 'A4', 'Letter'] else None,
+            width=f"{size_config['width']}in" if paper_size not in ['A3', 'A4', 'Letter'] else None,
+            height=f"{size_config['height']}in" if paper_size not in ['A3', 'A4', 'Letter'] else None,
+            print_background=True,
+            prefer_css_page_size=True
+        )
+        
+        logger.info(f"PDF exported successfully: {output_path} (Vector: {pdf_vector})")
+        return True
+    
+    def _svg_to_pdf(self, svg_content: str, output_path: str):
+        """Convert SVG markup to a vector PDF scaled to the paper width"""
+        paper_size = self.config.get('export.pdf_paper_size', 'A4')
+        size_config = PAPER_SIZES.get(paper_size, PAPER_SIZES['A4'])
+        
+        # cairosvg sizes output in CSS pixels (96 per inch); the height
+        # follows the diagram's aspect ratio
+        cairosvg.svg2pdf(
+            bytestring=svg_content.encode('utf-8'),
+            write_to=output_path,
+            output_width=size_config['width'] * 96
+        )
+    
+    def _get_png_settings(self) -> Tuple[int, int, int, float]:
+        """
+        Get resolved PNG export settings
+        
+        Returns:
+            (png_dpi, png_width, png_height, scale_factor), cached until the
+            config changes
+        """
+        revision = self.config.revision
+        if self._png_settings is None or self._png_settings_revision != revision:
+            png_dpi = self.config.get('export.png_dpi', 300)
+            png_width = self.config.get('export.png_width', 1920)
+            png_height = self.config.get('export.png_height', 1080)
+            
+            # Calculate scale factor: scale = dpi / 72
+            scale_factor = png_dpi / 72.0
+            
+            self._png_settings = (png_dpi, png_width, png_height, scale_factor)
+            self._png_settings_revision = revision
+        return self._png_settings
+    
+    def _set_png_dpi(self, png_bytes: bytes, dpi: int) -> bytes:
+        """
+        Set DPI metadata on PNG data by splicing in a pHYs chunk
+        
+        Works on the raw chunk stream, so the image is never decoded.
+        
+        Args:
+            png_bytes: Encoded PNG data
+            dpi: Dots per inch to record
+            
+        Returns:
+            PNG data with the pHYs chunk set (unchanged data on failure)
+        """
+        try:
+            if png_bytes[:8] != b'\x89PNG\r\n\x1a\n':
+                raise ValueError("not a PNG stream")
+            
+            # pHYs stores pixels per metre; unit specifier 1 = metre
+            ppm = int(round(dpi / 0.0254))
+            phys_data = struct.pack('>IIB', ppm, ppm, 1)
+            phys_chunk = (struct.pack('>I', len(phys_data)) + b'pHYs' + phys_data +
+                          struct.pack('>I', zlib.crc32(b'pHYs' + phys_data)))
+            
+            chunks = [png_bytes[:8]]
+            pos = 8
+            while pos < len(png_bytes):
+                length, = struct.unpack_from('>I', png_bytes, pos)
+                chunk_type = png_bytes[pos + 4:pos + 8]
+                end = pos + 12 + length
+                if end > len(png_bytes):
+                    raise ValueError("truncated PNG stream")
+                if chunk_type != b'pHYs':
+                    chunks.append(png_bytes[pos:end])
+                if chunk_type == b'IHDR':
+                    chunks.append(phys_chunk)
+                pos = end
+            
+            logger.debug(f"PNG DPI metadata set to {dpi}")
+            return b''.join(chunks)
+        except Exception as e:
+            logger.warning(f"Failed to set PNG DPI metadata: {e}")
+            return png_bytes
+    
+    async def _render_svg_with_node(self, html_content: str) -> Optional[str]:
+        """
+        Render the page with D3 under Node.js + jsdom, without a browser
+        
+        Requires ``node`` on PATH and the ``jsdom`` npm package (installed
+        with ``npm install --prefix src/assets/node``). The page gets the
+        configured export viewport (png_width x png_height).
+        
+        Returns:
+            Outer markup of the first SVG element, or None to fall back to Chromium
+        """
+        if not self._node_renderer_available:
+            return None
+        
+        node = shutil.which('node')
+        if node is None or not NODE_SVG_RENDERER.exists():
+            self._node_renderer_available = False
+            return None
+        
+        png_width, png_height = self._get_png_settings()[1:3]
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                node, str(NODE_SVG_RENDERER), str(png_width), str(png_height),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(html_content.encode('utf-8')),
+                timeout=NODE_RENDER_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.debug("Node SVG renderer timed out, falling back to Chromium")
+            return None
+        except OSError as e:
+            logger.debug(f"Node SVG renderer unavailable: {e}")
+            self._node_renderer_available = False
+            return None
+        
+        if proc.returncode == NODE_RENDER_NO_JSDOM:
+            logger.debug("jsdom is not installed; SVG exports will use Chromium")
+            self._node_renderer_available = False
+            return None
+        
+        if proc.returncode != 0 or not stdout:
+            logger.debug(f"Node SVG renderer failed, falling back to Chromium: "
+                         f"{stderr.decode('utf-8', 'replace').strip()}")
+            return None
+        
+        return stdout.decode('utf-8')
+    
+    async def _get_browser(self):
+        """Launch the shared headless browser on first use"""
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    # Relaunch after a disconnect: nothing of the old
+                    # browser may be reused
+                    await self._discard_pools()
+                    await self._close_contexts(self._browser)
+                if self._playwright is None:
+                    # Imported on first export: playwright pulls in dozens of
+                    # modules that app startup does not need
+                    from playwright.async_api import async_playwright
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True, args=LAUNCH_ARGS, chromium_sandbox=False
+                )
+                self._cdp_sessions.clear()
+                logger.debug("Export browser launched")
+            return self._browser
+    
+    async def _acquire_page(self, diagram_type: str):
+        """
+        Rent a warm page for the diagram type from the pool
+        
+        Pages are created lazily up to export.page_pool_size per type and
+        render settings; after that callers wait for a page to be released.
+        Pools built for outdated render settings are closed; callers waiting
+        on a discarded pool retry on the current one.
+        
+        Returns:
+            (pool, page) tuple; pass both back to _release_page
+        """
+        while True:
+            png_dpi, png_width, png_height, scale_factor = self._get_png_settings()
+            
+            browser = await self._get_browser()
+            
+            pool_size = self.config.get('export.page_pool_size', PAGE_POOL_SIZE)
+            
+            pool_key = (diagram_type, png_width, png_height, scale_factor)
+            pool = self._page_pools.get(pool_key)
+            if pool is None:
+                # Registered before awaiting, so concurrent callers share it
+                pool = self._page_pools[pool_key] = asyncio.Queue()
+                self._page_counts[pool] = 0
+                await self._discard_pools(diagram_type, keep=pool_key)
+            
+            if pool.empty() and self._page_counts[pool] < pool_size:
+                self._page_counts[pool] += 1
+                try:
+                    # Viewport is in CSS pixels; device_scale_factor alone
+                    # yields png_width*scale x png_height*scale device pixels
+                    page = await browser.new_page(
+                        viewport={'width': png_width, 'height': png_height},
+                        device_scale_factor=scale_factor,
+                        service_workers='block'
+                    )
+                except Exception:
+                    if pool in self._page_counts:
+                        self._page_counts[pool] -= 1
+                    raise
+                return pool, page
+            
+            page = await pool.get()
+            if page is not None:
+                return pool, page
+            
+            # Pool was discarded while waiting: pass the wake-up on to the
+            # next waiter and retry, unless the manager was closed
+            pool.put_nowait(None)
+            if self._browser is None:
+                raise RuntimeError("Export browser was closed")
+    
+    async def _release_page(self, pool, page):
+        """
+        Return a rented page to its pool
+        
+        The page is navigated to about:blank so the previous diagram's DOM
+        is released while it sits idle. Pages that are closed, fail to
+        reset, or belong to a discarded pool are closed instead.
+        """
+        if pool not in self._page_counts:
+            # Pool was discarded (settings changed or browser relaunched)
+            await self._close_page(page)
+            return
+        
+        try:
+            if not page.is_closed():
+                await page.goto('about:blank')
+                if pool in self._page_counts:
+                    pool.put_nowait(page)
+                    return
+        except Exception as e:
+            logger.debug(f"Dropping export page that failed to reset: {e}")
+        
+        if pool in self._page_counts:
+            self._page_counts[pool] -= 1
+        await self._close_page(page)
+    
+    async def _discard_pools(self, diagram_type: Optional[str] = None,
+                             keep: Optional[Tuple] = None):
+        """
+        Close the idle pages of every pool for a diagram type (all types
+        when None), except the pool keyed by keep, and wake the callers
+        waiting on those pools
+        """
+        for pool_key in [key for key in self._page_pools
+                         if (diagram_type is None or key[0] == diagram_type)
+                         and key != keep]:
+            pool = self._drop_pool(pool_key)
+            while not pool.empty():
+                page = pool.get_nowait()
+                if page is not None:
+                    await self._close_page(page)
+            pool.put_nowait(None)
+    
+    def _drop_pool(self, pool_key: Tuple) -> asyncio.Queue:
+        """Forget a pool; pages rented from it are closed on release"""
+        pool = self._page_pools.pop(pool_key)
+        del self._page_counts[pool]
+        return pool
+    
+    async def _close_contexts(self, browser):
+        """Close every context of a browser that is being replaced"""
+        for context in list(browser.contexts):
+            try:
+                await asyncio.wait_for(context.close(), BROWSER_CLOSE_TIMEOUT)
+            except Exception as e:
+                logger.debug(f"Failed to close export browser context: {e}")
+    
+    async def _close_page(self, page):
+        """Close a page and its browser context, ignoring errors"""
+        self._cdp_sessions.pop(page, None)
+        try:
+            await page.context.close()
+        except Exception as e:
+            logger.debug(f"Failed to close export page: {e}")
+    
+    async def close(self):
+        """
+        Close pooled pages, the shared browser and Playwright
+        
+        Each step is bounded by BROWSER_CLOSE_TIMEOUT so a hung Chromium
+        cannot block application shutdown.
+        """
+        browser, playwright = self._browser, self._playwright
+        self._browser = None
+        self._playwright = None
+        
+        # Cleared before waking waiters so they fail instead of relaunching
+        for pool_key in list(self._page_pools):
+            self._drop_pool(pool_key).put_nowait(None)
+        self._cdp_sessions.clear()
+        
+        if browser is None and playwright is None:
+            return
+        
+        # Each step is bounded on its own, so a hung browser still lets
+        # Playwright's driver process stop
+        steps = [('browser', browser.close if browser is not None else None),
+                 ('Playwright', playwright.stop if playwright is not None else None)]
+        for name, step in steps:
+            if step is None:
+                continue
+            try:
+                await asyncio.wait_for(step(), BROWSER_CLOSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"Export {name} did not close in time; abandoning it")
+            except Exception as e:
+                logger.warning(f"Failed to close export {name}: {e}")
+        
+        logger.debug("Export browser closed")
+    
     def get_export_settings(self) -> Dict:
         """Get current export settings from config"""
         return {
@@ -371,7 +1139,9 @@ class ExportManager:
             'png_height': self.config.get('export.png_height', 1080),
             'png_keep_aspect': self.config.get('export.png_keep_aspect', True),
             'pdf_vector': self.config.get('export.pdf_vector', True),
-            'pdf_paper_size': self.config.get('export.pdf_paper_size', 'A4')
+            'pdf_cairosvg': self.config.get('export.pdf_cairosvg', False),
+            'pdf_paper_size': self.config.get('export.pdf_paper_size', 'A4'),
+            'webp_quality': self.config.get('export.webp_quality', 90)
         }
     
     def update_export_settings(self, settings: Dict):
@@ -381,30 +1151,11 @@ class ExportManager:
         
         logger.info("Export settings updated")
     
-    def get_recommended_settings(self, use_case: str) -> Dict:
+    def get_recommended_settings(self, use_case: str) -> Mapping:
         """
         Get recommended export settings based on use case
         From design document specifications
-        """
-        recommendations = {
-            'web': {
-                'png_dpi': 72,
-                'png_width': 1920,
-                'png_height': 1080,
-                'pdf_paper_size': 'A4'
-            },
-            'presentation': {
-                'png_dpi': 150,
-                'png_width': 1920,
-                'png_height': 1080,
-                'pdf_paper_size': 'A4'
-            },
-            'print': {
-                'png_dpi': 300,
-                'png_width': 3840,
-                'png_height': 2160,
-                'pdf_paper_size': 'A3'
-            }
-        }
         
-        return recommendations.get(use_case, recommendations['web'])
\ No newline at end of file
+        Returns a shared read-only mapping; copy it before modifying.
+        """
+        return RECOMMENDED_SETTINGS.get(use_case, RECOMMENDED_SETTINGS['web'])
\ No newline at end of file
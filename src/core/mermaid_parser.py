@@ -5,34 +5,48 @@ Handles Mermaid notation parsing and validation for flowcharts
 """
 
 import re
+import string
 import json
-from typing import Dict, List, Optional, Tuple, Any
+import functools
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 from dataclasses import dataclass
 
 from ..utils.logger import logger
 
 
+# Number of distinct Mermaid texts whose parse results are memoized
+PARSE_CACHE_SIZE = 128
+
+# Number of distinct nodes kept interned across parses
+NODE_INTERN_SIZE = 4096
+
+# Number of generated flowchart templates kept per (direction, steps)
+FLOWCHART_TEMPLATE_CACHE_SIZE = 64
+
+
 class MermaidParseError(Exception):
     """Mermaid parsing error"""
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MermaidNode:
-    """Represents a Mermaid diagram node"""
+    """Represents a Mermaid diagram node (immutable, interned by the parser)"""
     id: str
     text: str
     shape: str
-    style: Optional[Dict[str, str]] = None
+    style: Optional[Mapping[str, str]] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MermaidEdge:
-    """Represents a Mermaid diagram edge"""
+    """Represents a Mermaid diagram edge (immutable)"""
     source: str
     target: str
     text: Optional[str] = None
-    style: Optional[Dict[str, str]] = None
+    style: Optional[Mapping[str, str]] = None
 
 
 class MermaidParser:
@@ -76,12 +90,33 @@ class MermaidParser:
     def parse_mermaid(mermaid_text: str) -> Dict[str, Any]:
         """Parse Mermaid notation text
         
+        Results are memoized per text; each call returns its own copy.
+        
         Args:
             mermaid_text: Mermaid formatted text
             
         Returns:
             Dictionary containing parsed diagram structure
             
+        Raises:
+            MermaidParseError: If parsing fails
+        """
+        return MermaidParser._copy_result(_parse_mermaid_cached(mermaid_text))
+    
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a parse result; cheaper than deepcopy for its fixed shape"""
+        return {
+            **result,
+            'nodes': [{**node, 'style': dict(node['style'])} for node in result['nodes']],
+            'edges': [{**edge, 'style': dict(edge['style'])} for edge in result['edges']],
+            'metadata': dict(result['metadata'])
+        }
+    
+    @staticmethod
+    def _parse_mermaid_uncached(mermaid_text: str) -> Dict[str, Any]:
+        """Parse Mermaid notation text without memoization
+        
         Raises:
             MermaidParseError: If parsing fails
         """
@@ -89,29 +124,35 @@ class MermaidParser:
             # Clean and normalize input
             mermaid_text = MermaidParser._clean_mermaid_text(mermaid_text)
             
-            # Parse diagram header
-            lines = mermaid_text.split('\n')
+            # Parse diagram header; splitlines handles \n, \r\n and \r alike
+            lines = mermaid_text.splitlines() or ['']
             diagram_info = MermaidParser._parse_diagram_header(lines[0])
             
-            # Parse nodes and edges
-            nodes = {}
-            edges = []
+            # Parse nodes and edges straight into result entries; nodes are
+            # keyed by id so redefinitions replace the entry in place
+            nodes: Dict[str, Dict[str, Any]] = {}
+            edges: List[Dict[str, Any]] = []
             
-            for line_num, line in enumerate(lines[1:], 2):
+            for line_num, line in enumerate(islice(lines, 1, None), 2):
                 line = line.strip()
                 if not line or line.startswith('%'):  # Skip empty lines and comments
                     continue
                 
                 try:
-                    # Try to parse as edge (connection)
-                    edge = MermaidParser._parse_edge(line, nodes)
-                    if edge:
-                        edges.append(edge)
-                    else:
+                    # Try to parse as edges (connections)
+                    line_edges = MermaidParser._parse_edges(line, nodes)
+                    for edge in line_edges:
+                        edges.append({
+                            'source': edge.source,
+                            'target': edge.target,
+                            'text': edge.text,
+                            'style': dict(edge.style or {})
+                        })
+                    if not line_edges:
                         # Try to parse as standalone node definition
                         node = MermaidParser._parse_node_definition(line)
                         if node:
-                            nodes[node.id] = node
+                            nodes[node.id] = MermaidParser._node_entry(node)
                 
                 except Exception as e:
                     logger.warning(f"Error parsing line {line_num}: '{line}' - {e}")
@@ -121,24 +162,8 @@ class MermaidParser:
             result = {
                 'type': diagram_info['type'],
                 'direction': diagram_info['direction'],
-                'nodes': [
-                    {
-                        'id': node.id,
-                        'text': node.text,
-                        'shape': node.shape,
-                        'style': node.style or {}
-                    }
-                    for node in nodes.values()
-                ],
-                'edges': [
-                    {
-                        'source': edge.source,
-                        'target': edge.target,
-                        'text': edge.text,
-                        'style': edge.style or {}
-                    }
-                    for edge in edges
-                ],
+                'nodes': list(nodes.values()),
+                'edges': edges,
                 'metadata': {
                     'total_nodes': len(nodes),
                     'total_edges': len(edges),
@@ -153,6 +178,16 @@ class MermaidParser:
             logger.error(f"Failed to parse Mermaid: {e}")
             raise MermaidParseError(f"Mermaid parsing failed: {e}")
     
+    @staticmethod
+    def _node_entry(node: MermaidNode) -> Dict[str, Any]:
+        """Convert a node to its parse result entry"""
+        return {
+            'id': node.id,
+            'text': node.text,
+            'shape': node.shape,
+            'style': dict(node.style or {})
+        }
+    
     @staticmethod
     def _clean_mermaid_text(mermaid_text: str) -> str:
         """Clean and normalize Mermaid text
@@ -167,10 +202,8 @@ class MermaidParser:
         if mermaid_text.startswith('\ufeff'):
             mermaid_text = mermaid_text[1:]
         
-        # Normalize line endings
-        mermaid_text = mermaid_text.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Remove leading/trailing whitespace
+        # Remove leading/trailing whitespace (line endings are normalized
+        # by splitlines in parse_mermaid)
         mermaid_text = mermaid_text.strip()
         
         return mermaid_text
@@ -190,27 +223,15 @@ class MermaidParser:
         """
         header_line = header_line.strip()
         
-        # Match flowchart with direction
-        flowchart_match = re.match(r'flowchart\s+(\w+)', header_line, re.IGNORECASE)
-        if flowchart_match:
-            direction = flowchart_match.group(1).upper()
+        # Match flowchart/graph with direction
+        header_match = _HEADER_RE.match(header_line)
+        if header_match:
+            direction = header_match.group(2).upper()
             if direction not in MermaidParser.DIRECTIONS:
                 logger.warning(f"Unknown direction '{direction}', using TD (top-down)")
                 direction = 'TD'
             return {
-                'type': 'flowchart',
-                'direction': direction
-            }
-        
-        # Match graph with direction
-        graph_match = re.match(r'graph\s+(\w+)', header_line, re.IGNORECASE)
-        if graph_match:
-            direction = graph_match.group(1).upper()
-            if direction not in MermaidParser.DIRECTIONS:
-                logger.warning(f"Unknown direction '{direction}', using TD (top-down)")
-                direction = 'TD'
-            return {
-                'type': 'graph',
+                'type': header_match.group(1).lower(),
                 'direction': direction
             }
         
@@ -224,70 +245,55 @@ class MermaidParser:
         raise MermaidParseError(f"Invalid diagram header: '{header_line}'. Expected 'flowchart <direction>' or 'graph <direction>'")
     
     @staticmethod
-    def _parse_edge(line: str, nodes: Dict[str, MermaidNode]) -> Optional[MermaidEdge]:
-        """Parse a line as an edge (connection between nodes)
+    def _parse_edges(line: str, nodes: Dict[str, Dict[str, Any]]) -> List[MermaidEdge]:
+        """Parse a line as a chain of edges (connections between nodes)
+        
+        A chained line such as 'A --> B -->|x| C' yields one edge per arrow.
         
         Args:
             line: Line to parse
-            nodes: Dictionary to store discovered nodes
+            nodes: Dictionary to store discovered nodes' result entries by id
             
         Returns:
-            MermaidEdge object if line represents an edge, None otherwise
+            MermaidEdge objects in line order; empty if the line has no arrow
         """
-        # Find arrow pattern
-        arrow_match = None
-        arrow_type = None
-        
-        for pattern, arrow_name in MermaidParser.ARROW_PATTERNS.items():
-            if pattern in line:
-                # Find the arrow with optional label
-                arrow_regex = re.escape(pattern)
-                
-                # Check for labeled arrow: -->|label|
-                labeled_match = re.search(f'{arrow_regex}\\|([^|]+)\\|', line)
-                if labeled_match:
-                    arrow_match = labeled_match
-                    arrow_type = arrow_name
-                    break
-                
-                # Check for simple arrow: -->
-                simple_match = re.search(arrow_regex, line)
-                if simple_match:
-                    arrow_match = simple_match
-                    arrow_type = arrow_name
-                    break
-        
-        if not arrow_match:
-            return None
-        
-        # Split line by arrow
-        arrow_pos = arrow_match.start()
-        source_part = line[:arrow_pos].strip()
-        target_part = line[arrow_match.end():].strip()
-        
-        # Parse source node
-        source_node = MermaidParser._parse_node_from_part(source_part)
-        if source_node:
-            nodes[source_node.id] = source_node
-        
-        # Parse target node
-        target_node = MermaidParser._parse_node_from_part(target_part)
-        if target_node:
-            nodes[target_node.id] = target_node
-        
-        # Extract edge label if present
-        edge_text = None
-        if '|' in arrow_match.group(0):
-            label_match = re.search(r'\|([^|]+)\|', arrow_match.group(0))
-            if label_match:
-                edge_text = label_match.group(1).strip()
-        
-        return MermaidEdge(
-            source=source_node.id if source_node else source_part,
-            target=target_node.id if target_node else target_part,
-            text=edge_text,
-            style={'type': arrow_type}
-        )
+        # Find every arrow, with its optional label, in one scan
+        arrow_matches = list(_ARROW_RE.finditer(line))
+        if not arrow_matches:
+            return []
+        
+        # Split line by arrows into the node parts between them
+        bounds = [0]
+        for arrow_match in arrow_matches:
+            bounds += (arrow_match.start(), arrow_match.end())
+        bounds.append(len(line))
+        
+        node_ids = []
+        for start, end in zip(bounds[::2], bounds[1::2]):
+            part = line[start:end].strip()
+            node = MermaidParser._parse_node_from_part(part)
+            if node:
+                nodes[node.id] = MermaidParser._node_entry(node)
+                node_ids.append(node.id)
+            else:
+                node_ids.append(part)
+        
+        edges = []
+        for index, arrow_match in enumerate(arrow_matches):
+            arrow_type = MermaidParser.ARROW_PATTERNS[arrow_match.group('arrow')]
+            
+            # Extract edge label if present
+            edge_text = arrow_match.group('label')
+            if edge_text is not None:
+                edge_text = edge_text.strip()
+            
+            edges.append(MermaidEdge(
+                source=node_ids[index],
+                target=node_ids[index + 1],
+                text=edge_text,
+                style=_EDGE_STYLES[arrow_type]
+            ))
+        return edges
     
     @staticmethod
     def _parse_node_from_part(part: str) -> Optional[MermaidNode]:
@@ -301,34 +307,49 @@ class MermaidParser:
         """
         part = part.strip()
         
-        # Try each node pattern
-        for pattern, shape in MermaidParser.NODE_PATTERNS.items():
-            match = re.search(pattern, part)
-            if match:
-                node_text = match.group(1).strip()
+        # Try each bracket pair in priority order
+        for open_char, close_char, shape in _NODE_BRACKETS:
+            found = MermaidParser._find_bracketed(part, open_char, close_char)
+            if found:
+                start, node_text = found
+                node_text = node_text.strip()
                 
                 # Extract node ID (everything before the shape)
-                node_id = part[:match.start()].strip()
+                node_id = part[:start].strip()
                 if not node_id:
                     # If no ID before shape, use the text as ID
-                    node_id = re.sub(r'[^a-zA-Z0-9_]', '_', node_text)
+                    node_id = _text_to_id(node_text)
                 
-                return MermaidNode(
-                    id=node_id,
-                    text=node_text,
-                    shape=shape
-                )
+                return _intern_node(node_id, node_text, shape)
         
         # If no shape pattern found, treat as simple node ID
-        if re.match(r'^[a-zA-Z0-9_]+$', part):
-            return MermaidNode(
-                id=part,
-                text=part,
-                shape='rect'
-            )
+        if part and _text_to_id(part) == part:
+            return _intern_node(part, part, 'rect')
         
         return None
     
+    @staticmethod
+    def _find_bracketed(part: str, open_char: str, close_char: str) -> Optional[Tuple[int, str]]:
+        """Find the first non-empty bracketed text, e.g. '[text]'
+        
+        Args:
+            part: Text to scan
+            open_char: Opening bracket
+            close_char: Closing bracket
+            
+        Returns:
+            (start index of the opening bracket, enclosed text), or None
+        """
+        start = part.find(open_char)
+        while start != -1:
+            end = part.find(close_char, start + 1)
+            if end == -1:
+                return None
+            if end > start + 1:
+                return start, part[start + 1:end]
+            start = part.find(open_char, start + 1)
+        return None
+    
     @staticmethod
     def _parse_node_definition(line: str) -> Optional[MermaidNode]:
         """Parse a standalone node definition
@@ -340,17 +361,13 @@ class MermaidParser:
             MermaidNode object if found, None otherwise
         """
         # Look for node definition pattern: nodeId[text] or nodeId(text), etc.
-        for pattern, shape in MermaidParser.NODE_PATTERNS.items():
-            match = re.search(f'([a-zA-Z0-9_]+)\\s*{pattern}', line)
+        for pattern_re, shape in _NODE_DEF_PATTERNS:
+            match = pattern_re.search(line)
             if match:
                 node_id = match.group(1).strip()
                 node_text = match.group(2).strip()
                 
-                return MermaidNode(
-                    id=node_id,
-                    text=node_text,
-                    shape=shape
-                )
+                return _intern_node(node_id, node_text, shape)
         
         return None
     
@@ -365,31 +382,56 @@ class MermaidParser:
             Tuple of (is_valid, error_message)
         """
         try:
-            result = MermaidParser.parse_mermaid(mermaid_text)
-            
-            # Additional validation
-            if not result['nodes']:
-                return False, "No nodes found in diagram"
-            
-            if not result['edges']:
-                return False, "No connections found in diagram"
-            
-            # Check for disconnected nodes
-            connected_nodes = set()
-            for edge in result['edges']:
-                connected_nodes.add(edge['source'])
-                connected_nodes.add(edge['target'])
-            
-            disconnected = [node['id'] for node in result['nodes'] if node['id'] not in connected_nodes]
-            if disconnected:
-                logger.warning(f"Disconnected nodes found: {disconnected}")
-            
-            return True, ""
-            
+            # Read-only use, so the shared memoized result needs no copy
+            result = _parse_mermaid_cached(mermaid_text)
         except MermaidParseError as e:
             return False, str(e)
         except Exception as e:
             return False, f"Validation error: {e}"
+        
+        return MermaidParser._validate_result(result)
+    
+    @staticmethod
+    def parse_and_validate(mermaid_text: str) -> Tuple[Optional[Dict[str, Any]], bool, str]:
+        """Parse and validate Mermaid notation with a single parse
+        
+        Args:
+            mermaid_text: Mermaid text to parse and validate
+            
+        Returns:
+            Tuple of (parsed result or None if parsing failed, is_valid,
+            error_message)
+        """
+        try:
+            result = _parse_mermaid_cached(mermaid_text)
+        except MermaidParseError as e:
+            return None, False, str(e)
+        except Exception as e:
+            return None, False, f"Validation error: {e}"
+        
+        is_valid, error_message = MermaidParser._validate_result(result)
+        return MermaidParser._copy_result(result), is_valid, error_message
+    
+    @staticmethod
+    def _validate_result(result: Dict[str, Any]) -> Tuple[bool, str]:
+        """Check a parse result for nodes, connections and disconnected nodes"""
+        if not result['nodes']:
+            return False, "No nodes found in diagram"
+        
+        if not result['edges']:
+            return False, "No connections found in diagram"
+        
+        # Check for disconnected nodes
+        connected_nodes = set()
+        for edge in result['edges']:
+            connected_nodes.add(edge['source'])
+            connected_nodes.add(edge['target'])
+        
+        disconnected = [node['id'] for node in result['nodes'] if node['id'] not in connected_nodes]
+        if disconnected:
+            logger.warning(f"Disconnected nodes found: {disconnected}")
+        
+        return True, ""
     
     @staticmethod
     def get_sample_flowchart() -> str:
@@ -424,6 +466,143 @@ class MermaidParser:
     Output --> End([終了])"""
 
 
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_mermaid_cached(mermaid_text: str) -> Dict[str, Any]:
+    """Memoized parse; the returned dict is shared and must not be modified"""
+    return MermaidParser._parse_mermaid_uncached(mermaid_text)
+
+
+def parse_mermaid(mermaid_text: str) -> Dict[str, Any]:
+    """Parse Mermaid notation text (see MermaidParser.parse_mermaid)"""
+    return MermaidParser.parse_mermaid(mermaid_text)
+
+
+@functools.lru_cache(maxsize=NODE_INTERN_SIZE)
+def _intern_node(node_id: str, text: str, shape: str) -> MermaidNode:
+    """Return the shared MermaidNode for an (id, text, shape) triple"""
+    return MermaidNode(id=node_id, text=text, shape=shape)
+
+
+class _IdentTable(dict):
+    """str.translate table keeping [a-zA-Z0-9_] and mapping anything else to '_'"""
+    
+    def __missing__(self, code: int) -> int:
+        self[code] = 0x5F  # '_'
+        return 0x5F
+
+
+_IDENT_TABLE = _IdentTable(
+    (code, code) for code in map(ord, string.ascii_letters + string.digits + '_')
+)
+
+
+@functools.lru_cache(maxsize=NODE_INTERN_SIZE)
+def _text_to_id(text: str) -> str:
+    """Derive a node ID from node text by replacing non-identifier characters"""
+    return text.translate(_IDENT_TABLE)
+
+
+# One shared read-only style mapping per arrow type
+_EDGE_STYLES = {
+    arrow_type: MappingProxyType({'type': arrow_type})
+    for arrow_type in MermaidParser.ARROW_PATTERNS.values()
+}
+
+# Patterns compiled once at import, derived from the MermaidParser tables
+# Bracket pairs for nodes inside edges, in NODE_PATTERNS priority order.
+# The nested shapes ('((', '[(', '[[', '[/', '[\\') always contain one of
+# these first, so they resolve to the outer bracket, as with the patterns.
+_NODE_BRACKETS = (
+    ('[', ']', 'rect'),
+    ('(', ')', 'round'),
+    ('{', '}', 'rhombus'),
+)
+_NODE_DEF_PATTERNS = [
+    (re.compile(f'([a-zA-Z0-9_]+)\\s*{pattern}'), shape)
+    for pattern, shape in MermaidParser.NODE_PATTERNS.items()
+]
+# Longest arrows first so '-.->' wins over its prefix '-.-'
+_ARROW_RE = re.compile(
+    '(?P<arrow>{})(?:\\|(?P<label>[^|]+)\\|)?'.format('|'.join(
+        re.escape(arrow)
+        for arrow in sorted(MermaidParser.ARROW_PATTERNS, key=len, reverse=True)
+    ))
+)
+_HEADER_RE = re.compile(r'(flowchart|graph)\s+(\w+)', re.IGNORECASE)
+
+
+# Default process steps for MermaidGenerator.generate_flowchart_template
+DEFAULT_FLOWCHART_STEPS = ("開始", "入力", "処理", "判定", "出力", "終了")
+
+# Workflow templates for MermaidGenerator.generate_workflow_template
+WORKFLOW_TEMPLATES = MappingProxyType({
+    "approval": """flowchart TD
+    Submit[申請提出] --> Review1{一次審査}
+    Review1 -->|承認| Review2{二次審査}
+    Review1 -->|差戻| Revise[修正]
+    Revise --> Submit
+    Review2 -->|承認| Approve[承認完了]
+    Review2 -->|差戻| Revise
+    Review2 -->|却下| Reject[却下]
+    Approve --> End1([処理完了])
+    Reject --> End2([終了])""",
+
+    "review": """flowchart LR
+    Create[文書作成] --> Submit[レビュー依頼]
+    Submit --> Review[レビュー実施]
+    Review --> Check{問題あり?}
+    Check -->|Yes| Feedback[フィードバック]
+    Feedback --> Revise[修正]
+    Revise --> Submit
+    Check -->|No| Approve[承認]
+    Approve --> Publish[公開]""",
+
+    "development": """flowchart TD
+    Plan[企画] --> Design[設計]
+    Design --> Dev[開発]
+    Dev --> Test[テスト]
+    Test --> Bug{バグあり?}
+    Bug -->|Yes| Fix[修正]
+    Fix --> Test
+    Bug -->|No| Deploy[デプロイ]
+    Deploy --> Monitor[監視]
+    Monitor --> Maintain[保守運用]"""
+})
+
+
+@functools.lru_cache(maxsize=FLOWCHART_TEMPLATE_CACHE_SIZE)
+def _build_flowchart_template(direction: str, steps: Tuple[str, ...]) -> str:
+    """Build the flowchart template for generate_flowchart_template"""
+    lines = [f"flowchart {direction}"]
+    
+    # Add nodes
+    for i, step in enumerate(steps):
+        node_id = f"step{i+1}"
+        
+        if i == 0:  # Start node
+            lines.append(f"    {node_id}([{step}])")
+        elif i == len(steps) - 1:  # End node
+            lines.append(f"    {node_id}([{step}])")
+        elif "判定" in step or "確認" in step:  # Decision node
+            lines.append(f"    {node_id}{{{step}}}")
+        else:  # Process node
+            lines.append(f"    {node_id}[{step}]")
+    
+    # Add connections
+    for i in range(len(steps) - 1):
+        source_id = f"step{i+1}"
+        target_id = f"step{i+2}"
+        
+        if "判定" in steps[i]:
+            lines.append(f"    {source_id} -->|Yes| {target_id}")
+            if i > 0:
+                lines.append(f"    {source_id} -->|No| step{i}")
+        else:
+            lines.append(f"    {source_id} --> {target_id}")
+    
+    return "\n".join(lines)
+
+
 class MermaidGenerator:
     """Mermaid notation generator for templates and examples"""
     
@@ -444,36 +623,10 @@ class MermaidGenerator:
             Mermaid flowchart string
         """
         if steps is None:
-            steps = ["開始", "入力", "処理", "判定", "出力", "終了"]
-        
-        lines = [f"flowchart {direction}"]
-        
-        # Add nodes
-        for i, step in enumerate(steps):
-            node_id = f"step{i+1}"
-            
-            if i == 0:  # Start node
-                lines.append(f"    {node_id}([{step}])")
-            elif i == len(steps) - 1:  # End node
-                lines.append(f"    {node_id}([{step}])")
-            elif "判定" in step or "確認" in step:  # Decision node
-                lines.append(f"    {node_id}{{{step}}}")
-            else:  # Process node
-                lines.append(f"    {node_id}[{step}]")
-        
-        # Add connections
-        for i in range(len(steps) - 1):
-            source_id = f"step{i+1}"
-            target_id = f"step{i+2}"
-            
-            if "判定" in steps[i]:
-                lines.append(f"    {source_id} -->|Yes| {target_id}")
-                if i > 0:
-                    lines.append(f"    {source_id} -->|No| step{i}")
-            else:
-                lines.append(f"    {source_id} --> {target_id}")
+            steps = DEFAULT_FLOWCHART_STEPS
         
-        return "\n".join(lines)
+        # Output depends only on direction and steps, so it is memoized
+        return _build_flowchart_template(direction, tuple(steps))
     
     @staticmethod
     def generate_decision_flowchart() -> str:
@@ -509,38 +662,4 @@ class MermaidGenerator:
         Returns:
             Mermaid flowchart string
         """
-        templates = {
-            "approval": """flowchart TD
-    Submit[申請提出] --> Review1{一次審査}
-    Review1 -->|承認| Review2{二次審査}
-    Review1 -->|差戻| Revise[修正]
-    Revise --> Submit
-    Review2 -->|承認| Approve[承認完了]
-    Review2 -->|差戻| Revise
-    Review2 -->|却下| Reject[却下]
-    Approve --> End1([処理完了])
-    Reject --> End2([終了])""",
-            
-            "review": """flowchart LR
-    Create[文書作成] --> Submit[レビュー依頼]
-    Submit --> Review[レビュー実施]
-    Review --> Check{問題あり?}
-    Check -->|Yes| Feedback[フィードバック]
-    Feedback --> Revise[修正]
-    Revise --> Submit
-    Check -->|No| Approve[承認]
-    Approve --> Publish[公開]""",
-            
-            "development": """flowchart TD
-    Plan[企画] --> Design[設計]
-    Design --> Dev[開発]
-    Dev --> Test[テスト]
-    Test --> Bug{バグあり?}
-    Bug -->|Yes| Fix[修正]
-    Fix --> Test
-    Bug -->|No| Deploy[デプロイ]
-    Deploy --> Monitor[監視]
-    Monitor --> Maintain[保守運用]"""
-        }
-        
-        return templates.get(workflow_type, templates["approval"])
\ No newline at end of file
+        return WORKFLOW_TEMPLATES.get(workflow_type, WORKFLOW_TEMPLATES["approval"])
\ No newline at end of file
@@ -5,11 +5,54 @@ SQLite database manager for D3-Mind-Flow-Editor
 
 import sqlite3
 import os
+import threading
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
 
-from .models import Diagram, DiagramType
+from .models import Diagram, DiagramType, _parse_timestamp
+
+
+# SQL statements, kept byte-identical across calls so sqlite3's
+# per-connection statement cache can reuse the prepared statements
+_SQL_SELECT_COLS = '''
+    SELECT id, title, description, diagram_type, mermaid_data,
+           node_styles, created_at, updated_at
+    FROM diagrams
+'''
+_SQL_INSERT = '''
+    INSERT INTO diagrams (
+        title, description, diagram_type, mermaid_data,
+        node_styles, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+_SQL_UPDATE = '''
+    UPDATE diagrams SET
+        title=?, description=?, diagram_type=?, mermaid_data=?,
+        node_styles=?, updated_at=?
+    WHERE id=?
+'''
+_SQL_SELECT_BY_ID = _SQL_SELECT_COLS + 'WHERE id=?'
+_SQL_SELECT_ALL = _SQL_SELECT_COLS + 'ORDER BY updated_at DESC'
+_SQL_SELECT_BY_TYPE = _SQL_SELECT_COLS + 'WHERE diagram_type=? ORDER BY updated_at DESC'
+_SQL_SEARCH = _SQL_SELECT_COLS + '''
+    WHERE title LIKE ? OR description LIKE ?
+    ORDER BY updated_at DESC
+'''
+_SQL_SEARCH_FTS = _SQL_SELECT_COLS + '''
+    WHERE id IN (SELECT rowid FROM diagrams_fts WHERE diagrams_fts MATCH ?)
+    ORDER BY updated_at DESC
+'''
+_SQL_DELETE = 'DELETE FROM diagrams WHERE id=?'
+
+# Shortest query the trigram search index can answer
+FTS_MIN_QUERY_LENGTH = 3
+
+# Triggers keeping the search index in sync with the diagrams table
+_FTS_TRIGGERS = ('diagrams_fts_insert', 'diagrams_fts_delete', 'diagrams_fts_update')
+
+# Prepared statements cached per connection
+SQL_STATEMENT_CACHE_SIZE = 256
 
 
 class DatabaseManager:
@@ -29,12 +72,29 @@ class DatabaseManager:
             self.db_path.parent.mkdir(exist_ok=True)
         else:
             self.db_path = Path(db_path)
+        
+        # One connection for the manager's lifetime; the lock serializes
+        # access in case it is used from worker threads
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=SQL_STATEMENT_CACHE_SIZE
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
             
         self._init_database()
     
     def _init_database(self):
-        """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        """Initialize connection settings and database tables"""
+        with self._lock, self._conn as conn:
+            # WAL keeps readers unblocked and, with synchronous=NORMAL,
+            # avoids an fsync per committed transaction
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-8000')
+            
             cursor = conn.cursor()
             
             # Create diagrams table
@@ -62,8 +122,72 @@ class DatabaseManager:
                 ON diagrams(created_at)
             ''')
             
+            self._fts_available = self._init_search_index(cursor)
+            
             conn.commit()
     
+    @staticmethod
+    def _init_search_index(cursor: sqlite3.Cursor) -> bool:
+        """Create the full-text search index over title and description
+        
+        Uses an FTS5 trigram index, which answers the same substring
+        queries as LIKE '%query%' (including Japanese text without word
+        breaks) without scanning the table. Triggers keep it in sync.
+        
+        Returns:
+            True if the index is available, False if this SQLite build
+            lacks FTS5 or the trigram tokenizer
+        """
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS diagrams_fts USING fts5(
+                    title, description,
+                    content='diagrams', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            # An index created by another SQLite build may exist but be
+            # unusable here; reading it fails with "no such module"
+            cursor.execute("SELECT 1 FROM diagrams_fts LIMIT 0")
+        except sqlite3.OperationalError:
+            # The sync triggers would make every write fail; drop them and
+            # search with LIKE instead
+            for trigger in _FTS_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            return False
+        
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type='trigger' AND name IN (?, ?, ?)",
+            _FTS_TRIGGERS
+        )
+        if cursor.fetchone()[0] == len(_FTS_TRIGGERS):
+            return True
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS diagrams_fts_insert AFTER INSERT ON diagrams BEGIN
+                INSERT INTO diagrams_fts(rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS diagrams_fts_delete AFTER DELETE ON diagrams BEGIN
+                INSERT INTO diagrams_fts(diagrams_fts, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS diagrams_fts_update AFTER UPDATE OF title, description ON diagrams BEGIN
+                INSERT INTO diagrams_fts(diagrams_fts, rowid, title, description)
+                VALUES ('delete', old.id, old.title, old.description);
+                INSERT INTO diagrams_fts(rowid, title, description)
+                VALUES (new.id, new.title, new.description);
+            END
+        ''')
+        
+        # Index diagrams saved before the search index (or its triggers)
+        # existed
+        cursor.execute("INSERT INTO diagrams_fts(diagrams_fts) VALUES ('rebuild')")
+        return True
+    
     def save_diagram(self, diagram: Diagram) -> int:
         """Save a diagram to database
         
@@ -73,31 +197,21 @@ class DatabaseManager:
         Returns:
             ID of the saved diagram
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             
             now = datetime.now()
             
             if diagram.id is None:
                 # Insert new diagram
-                cursor.execute('''
-                    INSERT INTO diagrams (
-                        title, description, diagram_type, mermaid_data, 
-                        node_styles, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(_SQL_INSERT, (
                     diagram.title, diagram.description, diagram.diagram_type,
                     diagram.mermaid_data, diagram.node_styles, now, now
                 ))
                 diagram_id = cursor.lastrowid
             else:
                 # Update existing diagram
-                cursor.execute('''
-                    UPDATE diagrams SET 
-                        title=?, description=?, diagram_type=?, mermaid_data=?,
-                        node_styles=?, updated_at=?
-                    WHERE id=?
-                ''', (
+                cursor.execute(_SQL_UPDATE, (
                     diagram.title, diagram.description, diagram.diagram_type,
                     diagram.mermaid_data, diagram.node_styles, now, diagram.id
                 ))
@@ -106,6 +220,43 @@ class DatabaseManager:
             conn.commit()
             return diagram_id
     
+    def save_many(self, diagrams: List[Diagram]) -> List[int]:
+        """Save several diagrams in a single transaction
+        
+        Updates are sent with one executemany call; inserts run one by one
+        inside the same transaction so their new IDs can be returned.
+        
+        Args:
+            diagrams: Diagram objects to save
+            
+        Returns:
+            IDs of the saved diagrams, in input order
+        """
+        with self._lock, self._conn as conn:
+            cursor = conn.cursor()
+            
+            now = datetime.now()
+            diagram_ids = []
+            updates = []
+            
+            for diagram in diagrams:
+                values = (
+                    diagram.title, diagram.description, diagram.diagram_type,
+                    diagram.mermaid_data, diagram.node_styles
+                )
+                if diagram.id is None:
+                    cursor.execute(_SQL_INSERT, values + (now, now))
+                    diagram_ids.append(cursor.lastrowid)
+                else:
+                    updates.append(values + (now, diagram.id))
+                    diagram_ids.append(diagram.id)
+            
+            if updates:
+                cursor.executemany(_SQL_UPDATE, updates)
+            
+            conn.commit()
+            return diagram_ids
+    
     def get_diagram(self, diagram_id: int) -> Optional[Diagram]:
         """Get a diagram by ID
         
@@ -115,28 +266,15 @@ class DatabaseManager:
         Returns:
             Diagram object or None if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, title, description, diagram_type, mermaid_data,
-                       node_styles, created_at, updated_at
-                FROM diagrams WHERE id=?
-            ''', (diagram_id,))
+            cursor.execute(_SQL_SELECT_BY_ID, (diagram_id,))
             
             row = cursor.fetchone()
             if row is None:
                 return None
             
-            return Diagram(
-                id=row[0],
-                title=row[1],
-                description=row[2],
-                diagram_type=row[3],
-                mermaid_data=row[4],
-                node_styles=row[5],
-                created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-                updated_at=datetime.fromisoformat(row[7]) if row[7] else None,
-            )
+            return self._row_to_diagram(row)
     
     def get_all_diagrams(self, diagram_type: Optional[str] = None) -> List[Diagram]:
         """Get all diagrams, optionally filtered by type
@@ -147,36 +285,31 @@ class DatabaseManager:
         Returns:
             List of Diagram objects
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             
             if diagram_type is None:
-                cursor.execute('''
-                    SELECT id, title, description, diagram_type, mermaid_data,
-                           node_styles, created_at, updated_at
-                    FROM diagrams ORDER BY updated_at DESC
-                ''')
+                cursor.execute(_SQL_SELECT_ALL)
             else:
-                cursor.execute('''
-                    SELECT id, title, description, diagram_type, mermaid_data,
-                           node_styles, created_at, updated_at
-                    FROM diagrams WHERE diagram_type=? ORDER BY updated_at DESC
-                ''', (diagram_type,))
+                cursor.execute(_SQL_SELECT_BY_TYPE, (diagram_type,))
             
-            diagrams = []
-            for row in cursor.fetchall():
-                diagrams.append(Diagram(
-                    id=row[0],
-                    title=row[1],
-                    description=row[2],
-                    diagram_type=row[3],
-                    mermaid_data=row[4],
-                    node_styles=row[5],
-                    created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-                    updated_at=datetime.fromisoformat(row[7]) if row[7] else None,
-                ))
-            
-            return diagrams
+            return [self._row_to_diagram(row) for row in cursor]
+    
+    @staticmethod
+    def _row_to_diagram(row: sqlite3.Row) -> Diagram:
+        """Build a Diagram from a diagrams table row"""
+        created_at = row['created_at']
+        updated_at = row['updated_at']
+        return Diagram(
+            id=row['id'],
+            title=row['title'],
+            description=row['description'],
+            diagram_type=row['diagram_type'],
+            mermaid_data=row['mermaid_data'],
+            node_styles=row['node_styles'],
+            created_at=_parse_timestamp(created_at) if created_at else None,
+            updated_at=_parse_timestamp(updated_at) if updated_at else None,
+        )
     
     def delete_diagram(self, diagram_id: int) -> bool:
         """Delete a diagram by ID
@@ -187,9 +320,9 @@ class DatabaseManager:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
-            cursor.execute('DELETE FROM diagrams WHERE id=?', (diagram_id,))
+            cursor.execute(_SQL_DELETE, (diagram_id,))
             conn.commit()
             return cursor.rowcount > 0
     
@@ -202,32 +335,24 @@ class DatabaseManager:
         Returns:
             List of matching Diagram objects
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
-            search_pattern = f'%{query}%'
             
-            cursor.execute('''
-                SELECT id, title, description, diagram_type, mermaid_data,
-                       node_styles, created_at, updated_at
-                FROM diagrams 
-                WHERE title LIKE ? OR description LIKE ?
-                ORDER BY updated_at DESC
-            ''', (search_pattern, search_pattern))
+            # Trigram matching needs at least three characters
+            if self._fts_available and len(query) >= FTS_MIN_QUERY_LENGTH:
+                # Quote the query as one FTS5 string so it is matched literally
+                phrase = '"' + query.replace('"', '""') + '"'
+                try:
+                    cursor.execute(_SQL_SEARCH_FTS, (phrase,))
+                    return [self._row_to_diagram(row) for row in cursor]
+                except sqlite3.OperationalError:
+                    # Index unusable (e.g. FTS5 missing); use LIKE from now on
+                    self._fts_available = False
             
-            diagrams = []
-            for row in cursor.fetchall():
-                diagrams.append(Diagram(
-                    id=row[0],
-                    title=row[1],
-                    description=row[2],
-                    diagram_type=row[3],
-                    mermaid_data=row[4],
-                    node_styles=row[5],
-                    created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-                    updated_at=datetime.fromisoformat(row[7]) if row[7] else None,
-                ))
+            search_pattern = f'%{query}%'
+            cursor.execute(_SQL_SEARCH, (search_pattern, search_pattern))
             
-            return diagrams
+            return [self._row_to_diagram(row) for row in cursor]
     
     def get_statistics(self) -> dict:
         """Get database statistics
@@ -235,22 +360,19 @@ class DatabaseManager:
         Returns:
             Dictionary with statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             
-            # Total count
-            cursor.execute('SELECT COUNT(*) FROM diagrams')
-            total_count = cursor.fetchone()[0]
-            
-            # Count by type
-            type_counts = {}
-            for diagram_type in DiagramType.all():
-                cursor.execute('SELECT COUNT(*) FROM diagrams WHERE diagram_type=?', (diagram_type,))
-                type_counts[diagram_type] = cursor.fetchone()[0]
+            # Total count and latest update
+            cursor.execute('SELECT COUNT(*), MAX(updated_at) FROM diagrams')
+            total_count, latest_update = cursor.fetchone()
             
-            # Latest update
-            cursor.execute('SELECT MAX(updated_at) FROM diagrams')
-            latest_update = cursor.fetchone()[0]
+            # Count by type (types without diagrams stay at zero)
+            type_counts = dict.fromkeys(DiagramType.all(), 0)
+            cursor.execute('SELECT diagram_type, COUNT(*) FROM diagrams GROUP BY diagram_type')
+            for diagram_type, count in cursor.fetchall():
+                if diagram_type in type_counts:
+                    type_counts[diagram_type] = count
             
             return {
                 'total_count': total_count,
@@ -260,5 +382,6 @@ class DatabaseManager:
             }
     
     def close(self):
-        """Close database connection (not needed with context manager usage)"""
-        pass
\ No newline at end of file
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -3,12 +3,21 @@
 Database models for D3-Mind-Flow-Editor
 """
 
+import functools
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterable, List, Mapping, Optional
 
+# Upper bound on distinct timestamp strings kept by _parse_timestamp
+TIMESTAMP_CACHE_SIZE = 4096
 
-@dataclass
+# Timestamps repeat across rows (bulk saves share one 'now'), and datetime
+# objects are immutable, so parsed values can be shared
+_parse_timestamp = functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)(datetime.fromisoformat)
+
+
+@dataclass(slots=True)
 class Diagram:
     """Diagram model representing a saved diagram"""
     
@@ -23,6 +32,8 @@ class Diagram:
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
+        created_at = self.created_at
+        updated_at = self.updated_at
         return {
             'id': self.id,
             'title': self.title,
@@ -30,32 +41,34 @@ class Diagram:
             'diagram_type': self.diagram_type,
             'mermaid_data': self.mermaid_data,
             'node_styles': self.node_styles,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'created_at': created_at.isoformat() if created_at else None,
+            'updated_at': updated_at.isoformat() if updated_at else None,
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Diagram':
         """Create from dictionary"""
-        created_at = None
-        updated_at = None
+        get = data.get
+        created_at = get('created_at')
+        updated_at = get('updated_at')
         
-        if data.get('created_at'):
-            created_at = datetime.fromisoformat(data['created_at'])
-        if data.get('updated_at'):
-            updated_at = datetime.fromisoformat(data['updated_at'])
-            
         return cls(
-            id=data.get('id'),
-            title=data.get('title', ''),
-            description=data.get('description', ''),
-            diagram_type=data.get('diagram_type', ''),
-            mermaid_data=data.get('mermaid_data', ''),
-            node_styles=data.get('node_styles'),
-            created_at=created_at,
-            updated_at=updated_at,
+            id=get('id'),
+            title=get('title', ''),
+            description=get('description', ''),
+            diagram_type=get('diagram_type', ''),
+            mermaid_data=get('mermaid_data', ''),
+            node_styles=get('node_styles'),
+            created_at=_parse_timestamp(created_at) if created_at else None,
+            updated_at=_parse_timestamp(updated_at) if updated_at else None,
         )
     
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> List['Diagram']:
+        """Create diagrams from a batch of dictionaries"""
+        from_dict = cls.from_dict
+        return [from_dict(data) for data in rows]
+    
     def __str__(self) -> str:
         return f"Diagram(id={self.id}, title='{self.title}', type='{self.diagram_type}')"
 
@@ -67,15 +80,20 @@ class DiagramType:
     FLOWCHART = "flowchart"
     
     @classmethod
-    def all(cls) -> list[str]:
+    def all(cls) -> tuple[str, ...]:
         """Get all diagram types"""
-        return [cls.MINDMAP, cls.GANTT, cls.FLOWCHART]
+        return _ALL_TYPES
     
     @classmethod
-    def display_names(cls) -> dict[str, str]:
-        """Get display names for diagram types"""
-        return {
-            cls.MINDMAP: "マインドマップ",
-            cls.GANTT: "ガントチャート", 
-            cls.FLOWCHART: "フローチャート"
-        }
\ No newline at end of file
+    def display_names(cls) -> Mapping[str, str]:
+        """Get display names for diagram types (read-only)"""
+        return _DISPLAY_NAMES
+
+
+# Shared immutable results for DiagramType.all() / display_names()
+_ALL_TYPES = (DiagramType.MINDMAP, DiagramType.GANTT, DiagramType.FLOWCHART)
+_DISPLAY_NAMES = MappingProxyType({
+    DiagramType.MINDMAP: "マインドマップ",
+    DiagramType.GANTT: "ガントチャート",
+    DiagramType.FLOWCHART: "フローチャート"
+})
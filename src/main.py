@@ -6,32 +6,48 @@ A desktop application for creating mind maps, flowcharts, and Gantt charts
 using D3.js visualization library with PySide6 interface.
 """
 
+import functools
+import importlib.util
+import re
+import signal
 import sys
 import os
 from pathlib import Path
 
-# Add src directory to Python path
+# Add src directory to Python path (once, even if this module is re-imported)
 src_dir = Path(__file__).parent
-sys.path.insert(0, str(src_dir.parent))
-sys.path.insert(0, str(src_dir))
+for _path in (str(src_dir.parent), str(src_dir)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Import PySide6 components with comprehensive compatibility checks
 try:
     from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
-    from PySide6.QtCore import Qt, QTimer, QTranslator, QLocale
+    from PySide6.QtCore import Qt, QEventLoop, QTimer
     from PySide6.QtGui import QPixmap, QPainter, QFont, QIcon, QLinearGradient
     
     # Check for PySide6 version compatibility
     import PySide6
-    PYSIDE6_VERSION = PySide6.__version__
+    PYSIDE6_VERSION = getattr(PySide6, '__version__', 'unknown')
+    # Tolerates dev/local versions such as 6.7.0a1 or 6.8.0.1+build; an
+    # unparseable version is treated as current (no legacy HiDPI setup)
+    _version_match = re.match(r'(\d+)\.(\d+)', PYSIDE6_VERSION)
+    _PYSIDE_VERSION_TUPLE = (
+        (int(_version_match.group(1)), int(_version_match.group(2)))
+        if _version_match else (6, 6)
+    )
+    
+    # HiDPI attributes that only exist on older Qt releases
+    _HAS_HIDPI_SCALING = hasattr(Qt, 'AA_EnableHighDpiScaling')
+    _HAS_HIDPI_PIXMAPS = hasattr(Qt, 'AA_UseHighDpiPixmaps')
 except ImportError as e:
     print(f"Critical Error: PySide6 import failed: {e}")
     print("Please install PySide6: pip install PySide6>=6.6.0")
     sys.exit(1)
 
 # Application imports with error handling
+# (src.ui.main_window is imported lazily, after the splash screen is up)
 try:
-    import src.ui.main_window as main_window_module
     import src.utils.config as config_module
     import src.utils.logger as logger_module
     import src.utils.resolution_manager as resolution_manager_module
@@ -46,16 +62,197 @@ APP_VERSION = "1.0.0"
 APP_AUTHOR = "seyaytua"
 APP_DESCRIPTION = "D3.js powered Mind Map, Flow Chart, and Gantt Chart Desktop Editor"
 
+# Alignment used for splash screen status messages
+_SPLASH_ALIGN = Qt.AlignBottom | Qt.AlignCenter
+
+# Top-level packages probed by check_dependencies()
+REQUIRED_DEPENDENCIES = ("PySide6", "playwright", "pypdf")
+
+
+# Application-wide Qt style sheet, applied once per QApplication
+_STYLESHEET = """
+QMainWindow {
+    background-color: #f5f5f5;
+}
+
+QToolBar {
+    background-color: #ffffff;
+    border: 1px solid #d0d0d0;
+    spacing: 3px;
+    padding: 2px;
+}
+
+QToolBar QToolButton {
+    background-color: transparent;
+    border: 1px solid transparent;
+    padding: 4px;
+    margin: 1px;
+    border-radius: 3px;
+}
+
+QToolBar QToolButton:hover {
+    background-color: #e0e0e0;
+    border: 1px solid #c0c0c0;
+}
+
+QToolBar QToolButton:pressed {
+    background-color: #d0d0d0;
+}
+
+QTabWidget::pane {
+    border: 1px solid #d0d0d0;
+    background-color: #ffffff;
+}
+
+QTabBar::tab {
+    background-color: #f0f0f0;
+    border: 1px solid #d0d0d0;
+    padding: 6px 12px;
+    margin-right: 2px;
+}
+
+QTabBar::tab:selected {
+    background-color: #ffffff;
+    border-bottom: 1px solid #ffffff;
+}
+
+QTabBar::tab:hover {
+    background-color: #e0e0e0;
+}
+
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #d0d0d0;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 5px;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+
+QPushButton {
+    background-color: #ffffff;
+    border: 1px solid #d0d0d0;
+    padding: 6px 12px;
+    border-radius: 3px;
+}
+
+QPushButton:hover {
+    background-color: #e0e0e0;
+}
+
+QPushButton:pressed {
+    background-color: #d0d0d0;
+}
+
+QPushButton:disabled {
+    background-color: #f5f5f5;
+    color: #a0a0a0;
+}
+
+QTextEdit, QLineEdit {
+    background-color: #ffffff;
+    border: 1px solid #d0d0d0;
+    border-radius: 3px;
+    padding: 4px;
+}
+
+QTextEdit:focus, QLineEdit:focus {
+    border: 2px solid #4CAF50;
+}
+
+QListWidget {
+    background-color: #ffffff;
+    border: 1px solid #d0d0d0;
+    border-radius: 3px;
+}
+
+QListWidget::item {
+    padding: 4px;
+    border-bottom: 1px solid #f0f0f0;
+}
+
+QListWidget::item:selected {
+    background-color: #4CAF50;
+    color: white;
+}
+
+QListWidget::item:hover {
+    background-color: #e8f5e8;
+}
+
+QComboBox {
+    background-color: #ffffff;
+    border: 1px solid #d0d0d0;
+    padding: 4px 8px;
+    border-radius: 3px;
+}
+
+QComboBox:hover {
+    border: 1px solid #4CAF50;
+}
+
+QComboBox::drop-down {
+    border: none;
+    width: 20px;
+}
+"""
+
+# Bundled as a file so Qt loads and caches it by path instead of decoding
+# an inline data: URL
+ARROW_DOWN_ICON = src_dir / "assets" / "icons" / "arrow-down.svg"
+_STYLESHEET += f"""
+QComboBox::down-arrow {{
+    image: url("{ARROW_DOWN_ICON.as_posix()}");
+}}
+"""
+
+
+@functools.cache
+def _build_app_icon() -> QIcon:
+    """Build the application icon once and share it across instances"""
+    # Create a simple icon for now
+    # TODO: Replace with actual icon file
+    pixmap = QPixmap(64, 64)
+    pixmap.fill(Qt.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    
+    # Draw a simple chart icon
+    painter.setBrush(Qt.blue)
+    painter.setPen(Qt.darkBlue)
+    painter.drawEllipse(10, 10, 20, 20)
+    painter.drawEllipse(30, 20, 20, 20)
+    painter.drawEllipse(20, 35, 20, 20)
+    
+    # Draw connections
+    painter.setPen(Qt.black)
+    painter.drawLine(25, 20, 35, 25)
+    painter.drawLine(30, 35, 35, 30)
+    
+    painter.end()
+    
+    return QIcon(pixmap)
+
 
 class Application(QApplication):
     """Main application class"""
     
-    def __init__(self, argv):
-        # Check if QApplication instance already exists
+    def __new__(cls, argv):
+        # Reuse the process-wide QApplication if one already exists
         existing_app = QApplication.instance()
         if existing_app is not None:
-            # Use existing instance
-            self.__dict__ = existing_app.__dict__
+            return existing_app
+        return super().__new__(cls)
+    
+    def __init__(self, argv):
+        # Already set up (instance returned by __new__)
+        if getattr(self, '_initialized', False):
             return
             
         super().__init__(argv)
@@ -73,29 +270,22 @@ class Application(QApplication):
         
         # Setup application
         self._setup_application()
+        self._initialized = True
         
     def _setup_application(self):
         """Setup application-wide settings"""
+        log = logger_module.logger
+        
         # Set up high DPI support (PySide6 6.6+ handles this automatically)
-        try:
-            # Only set these attributes for older PySide6 versions
-            # Newer versions (6.6+) handle high DPI automatically
-            import PySide6
-            version_info = PySide6.__version__.split('.')
-            major, minor = int(version_info[0]), int(version_info[1])
-            
-            if major < 6 or (major == 6 and minor < 6):
-                # Only for older versions
-                if hasattr(Qt, 'AA_EnableHighDpiScaling'):
-                    self.setAttribute(Qt.AA_EnableHighDpiScaling)
-                if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
-                    self.setAttribute(Qt.AA_UseHighDpiPixmaps)
-                logger_module.logger.debug(f"Applied HiDPI attributes for PySide6 {PySide6.__version__}")
-            else:
-                logger_module.logger.debug(f"PySide6 {PySide6.__version__} handles HiDPI automatically")
-        except (AttributeError, ImportError, ValueError) as e:
-            # Fallback: newer versions handle HiDPI automatically
-            logger_module.logger.debug(f"HiDPI setup skipped: {e}")
+        # Only set these attributes for older PySide6 versions
+        if _PYSIDE_VERSION_TUPLE < (6, 6):
+            if _HAS_HIDPI_SCALING:
+                self.setAttribute(Qt.AA_EnableHighDpiScaling)
+            if _HAS_HIDPI_PIXMAPS:
+                self.setAttribute(Qt.AA_UseHighDpiPixmaps)
+            log.debug(f"Applied HiDPI attributes for PySide6 {PYSIDE6_VERSION}")
+        else:
+            log.debug(f"PySide6 {PYSIDE6_VERSION} handles HiDPI automatically")
         
         # Set application style
         self.setStyle('Fusion')  # Modern cross-platform style
@@ -103,18 +293,18 @@ class Application(QApplication):
         # Load configuration
         try:
             self.config = config_module.Config()
-            logger_module.logger.info(f"Configuration loaded from: {self.config.config_path}")
+            log.info(f"Configuration loaded from: {self.config.config_path}")
         except Exception as e:
-            logger_module.logger.error(f"Failed to load configuration: {e}")
+            log.error(f"Failed to load configuration: {e}")
             QMessageBox.critical(None, "設定エラー", f"設定の読み込みに失敗しました: {e}")
             sys.exit(1)
         
         # Setup resolution management
         try:
             self.resolution_manager = resolution_manager_module.ResolutionManager(self.config)
-            logger_module.logger.info(f"Resolution manager initialized: {self.resolution_manager.get_display_info()}")
+            log.info(f"Resolution manager initialized: {self.resolution_manager.get_display_info()}")
         except Exception as e:
-            logger_module.logger.warning(f"Resolution manager initialization failed: {e}")
+            log.warning(f"Resolution manager initialization failed: {e}")
         
         # Setup application icon
         self._setup_app_icon()
@@ -124,170 +314,11 @@ class Application(QApplication):
         
     def _setup_app_icon(self):
         """Setup application icon"""
-        # Create a simple icon for now
-        # TODO: Replace with actual icon file
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Draw a simple chart icon
-        painter.setBrush(Qt.blue)
-        painter.setPen(Qt.darkBlue)
-        painter.drawEllipse(10, 10, 20, 20)
-        painter.drawEllipse(30, 20, 20, 20)
-        painter.drawEllipse(20, 35, 20, 20)
-        
-        # Draw connections
-        painter.setPen(Qt.black)
-        painter.drawLine(25, 20, 35, 25)
-        painter.drawLine(30, 35, 35, 30)
-        
-        painter.end()
-        
-        self.setWindowIcon(QIcon(pixmap))
+        self.setWindowIcon(_build_app_icon())
     
     def _setup_stylesheet(self):
         """Setup application stylesheet"""
-        # Basic stylesheet for consistent appearance
-        stylesheet = """
-        QMainWindow {
-            background-color: #f5f5f5;
-        }
-        
-        QToolBar {
-            background-color: #ffffff;
-            border: 1px solid #d0d0d0;
-            spacing: 3px;
-            padding: 2px;
-        }
-        
-        QToolBar QToolButton {
-            background-color: transparent;
-            border: 1px solid transparent;
-            padding: 4px;
-            margin: 1px;
-            border-radius: 3px;
-        }
-        
-        QToolBar QToolButton:hover {
-            background-color: #e0e0e0;
-            border: 1px solid #c0c0c0;
-        }
-        
-        QToolBar QToolButton:pressed {
-            background-color: #d0d0d0;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #d0d0d0;
-            background-color: #ffffff;
-        }
-        
-        QTabBar::tab {
-            background-color: #f0f0f0;
-            border: 1px solid #d0d0d0;
-            padding: 6px 12px;
-            margin-right: 2px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #ffffff;
-            border-bottom: 1px solid #ffffff;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #e0e0e0;
-        }
-        
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #d0d0d0;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 5px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-        }
-        
-        QPushButton {
-            background-color: #ffffff;
-            border: 1px solid #d0d0d0;
-            padding: 6px 12px;
-            border-radius: 3px;
-        }
-        
-        QPushButton:hover {
-            background-color: #e0e0e0;
-        }
-        
-        QPushButton:pressed {
-            background-color: #d0d0d0;
-        }
-        
-        QPushButton:disabled {
-            background-color: #f5f5f5;
-            color: #a0a0a0;
-        }
-        
-        QTextEdit, QLineEdit {
-            background-color: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 3px;
-            padding: 4px;
-        }
-        
-        QTextEdit:focus, QLineEdit:focus {
-            border: 2px solid #4CAF50;
-        }
-        
-        QListWidget {
-            background-color: #ffffff;
-            border: 1px solid #d0d0d0;
-            border-radius: 3px;
-        }
-        
-        QListWidget::item {
-            padding: 4px;
-            border-bottom: 1px solid #f0f0f0;
-        }
-        
-        QListWidget::item:selected {
-            background-color: #4CAF50;
-            color: white;
-        }
-        
-        QListWidget::item:hover {
-            background-color: #e8f5e8;
-        }
-        
-        QComboBox {
-            background-color: #ffffff;
-            border: 1px solid #d0d0d0;
-            padding: 4px 8px;
-            border-radius: 3px;
-        }
-        
-        QComboBox:hover {
-            border: 1px solid #4CAF50;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-        
-        QComboBox::down-arrow {
-            image: url(data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMTIiIGhlaWdodD0iMTIiIHZpZXdCb3g9IjAgMCAxMiAxMiIgZmlsbD0ibm9uZSIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIj4KPHBhdGggZD0iTTMgNUw2IDhMOSA1IiBzdHJva2U9IiM2NjY2NjYiIHN0cm9rZS13aWR0aD0iMiIgc3Ryb2tlLWxpbmVjYXA9InJvdW5kIiBzdHJva2UtbGluZWpvaW49InJvdW5kIi8+Cjwvc3ZnPgo=);
-        }
-        """
-        
-        self.setStyleSheet(stylesheet)
+        self.setStyleSheet(_STYLESHEET)
     
     def create_splash_screen(self) -> QSplashScreen:
         """Create and show splash screen"""
@@ -331,44 +362,34 @@ class Application(QApplication):
     
     def run(self):
         """Run the application"""
+        log = logger_module.logger
         try:
-            # Show splash screen
+            # Show splash screen; a single pump paints it with its first message
             splash = self.create_splash_screen()
             splash.show()
-            self.processEvents()
+            # Signal handling for graceful shutdown, once the event loop idles
+            QTimer.singleShot(0, install_signal_handlers)
+            splash.showMessage("メインウィンドウを初期化中...", _SPLASH_ALIGN)
+            self.processEvents(QEventLoop.ExcludeUserInputEvents)
             
             # Initialize main window
-            splash.showMessage("メインウィンドウを初期化中...", Qt.AlignBottom | Qt.AlignCenter)
-            self.processEvents()
-            
+            import src.ui.main_window as main_window_module
             self.main_window = main_window_module.MainWindow()
             
-            # Setup main window
-            splash.showMessage("UIコンポーネントを設定中...", Qt.AlignBottom | Qt.AlignCenter)
-            self.processEvents()
-            
-            # Show main window
-            splash.showMessage("アプリケーションを開始中...", Qt.AlignBottom | Qt.AlignCenter)
-            self.processEvents()
+            # Show main window (painted by the event loop below)
+            splash.showMessage("アプリケーションを開始中...", _SPLASH_ALIGN)
             
-            # Close splash screen and show main window with proper timer handling
-            close_timer = QTimer()
-            close_timer.setSingleShot(True)
-            close_timer.timeout.connect(splash.close)
-            close_timer.start(1000)
+            # Close splash screen and show main window once the event loop runs
+            QTimer.singleShot(1000, splash.close)
+            QTimer.singleShot(1000, self.main_window.show)
             
-            show_timer = QTimer()
-            show_timer.setSingleShot(True)
-            show_timer.timeout.connect(self.main_window.show)
-            show_timer.start(1000)
-            
-            logger_module.logger.info(f"{APP_NAME} v{APP_VERSION} started successfully")
+            log.info(f"{APP_NAME} v{APP_VERSION} started successfully")
             
             # Start event loop
             return self.exec()
             
         except Exception as e:
-            logger_module.logger.critical(f"Fatal error during application startup: {e}")
+            log.critical(f"Fatal error during application startup: {e}")
             
             # Show error dialog
             error_dialog = QMessageBox()
@@ -383,57 +404,66 @@ class Application(QApplication):
     
     def closeEvent(self, event):
         """Handle application close"""
-        logger_module.logger.info("Application closing")
+        log = logger_module.logger
+        log.info("Application closing")
         
         # Save configuration
         if self.config:
             try:
                 self.config.save()
-                logger_module.logger.debug("Configuration saved")
+                log.debug("Configuration saved")
             except Exception as e:
-                logger_module.logger.warning(f"Failed to save configuration: {e}")
+                log.warning(f"Failed to save configuration: {e}")
         
         event.accept()
 
 
-def setup_exception_handling():
-    """Setup global exception handling"""
-    def handle_exception(exc_type, exc_value, exc_traceback):
-        if issubclass(exc_type, KeyboardInterrupt):
-            sys.__excepthook__(exc_type, exc_value, exc_traceback)
-            return
-        
-        logger_module.logger.critical(
-            f"Uncaught exception: {exc_type.__name__}: {exc_value}",
-            exc_info=(exc_type, exc_value, exc_traceback)
-        )
+def _handle_exception(exc_type, exc_value, exc_traceback):
+    """Log uncaught exceptions (installed as sys.excepthook)"""
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
     
-    sys.excepthook = handle_exception
+    logger_module.logger.critical(
+        f"Uncaught exception: {exc_type.__name__}: {exc_value}",
+        exc_info=(exc_type, exc_value, exc_traceback)
+    )
+
+
+def setup_exception_handling():
+    """Setup global exception handling (safe to call more than once)"""
+    if sys.excepthook is not _handle_exception:
+        sys.excepthook = _handle_exception
+
+
+def _handle_signal(signum, frame):
+    """Quit the running QApplication on SIGINT/SIGTERM"""
+    logger_module.logger.info(f"Received signal {signum}, shutting down...")
+    app = QApplication.instance()
+    if app is not None:
+        app.quit()
+
+
+_signals_installed = False
+
+
+def install_signal_handlers():
+    """Register SIGINT/SIGTERM handlers once per process"""
+    global _signals_installed
+    if _signals_installed:
+        return
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+    _signals_installed = True
 
 
 def check_dependencies():
     """Check if all required dependencies are available"""
-    missing_deps = []
-    
-    try:
-        import PySide6
-    except ImportError:
-        missing_deps.append("PySide6")
-    
-    try:
-        import playwright
-    except ImportError:
-        missing_deps.append("playwright")
-    
-    try:
-        from PIL import Image
-    except ImportError:
-        missing_deps.append("Pillow")
-    
-    try:
-        import pypdf
-    except ImportError:
-        missing_deps.append("pypdf")
+    # find_spec only locates the package; nothing is imported or executed
+    missing_deps = [
+        name for name in REQUIRED_DEPENDENCIES
+        if importlib.util.find_spec(name) is None
+    ]
     
     if missing_deps:
         print(f"Error: Missing required dependencies: {', '.join(missing_deps)}")
@@ -491,6 +521,7 @@ def main():
             def exec(self):
                 # Create main window manually
                 try:
+                    import src.ui.main_window as main_window_module
                     main_window = main_window_module.MainWindow()
                     main_window.show()
                     logger_module.logger.info(f"{APP_NAME} v{APP_VERSION} started with existing QApplication")
@@ -500,18 +531,13 @@ def main():
                     return 1
         
         app = ExistingAppWrapper(existing_app)
+        
+        # Set up signal handling for graceful shutdown
+        install_signal_handlers()
     else:
+        # Application.run() installs signal handlers once the splash is up
         app = Application(sys.argv)
     
-    # Set up signal handling for graceful shutdown
-    import signal
-    def signal_handler(signum, frame):
-        logger_module.logger.info(f"Received signal {signum}, shutting down...")
-        app.quit()
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     # Run application
     try:
         # Use the appropriate execution method
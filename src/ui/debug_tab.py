@@ -5,27 +5,162 @@ Debug tab for D3-Mind-Flow-Editor
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
-    QLabel, QComboBox, QCheckBox, QSplitter
+    QLabel, QComboBox, QCheckBox, QSplitter, QListView
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QTextCharFormat, QColor, QTextCursor
+from PySide6.QtCore import Qt, QTimer, QAbstractListModel, QModelIndex, Signal
+from PySide6.QtGui import QFont, QColor
 
 import logging
+import logging.handlers
+import queue
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional
 
 from ..utils.logger import logger
 
+# Numeric severity per level filter value ("ALL" admits every entry)
+_LEVEL_VALUES = {
+    "ALL": 0,
+    "DEBUG": 10,
+    "INFO": 20,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50
+}
+
+# Delay between batched writes of new log lines to the display
+LOG_FLUSH_INTERVAL_MS = 33
+
+# Drain interval and per-tick cap for captured log records; the timer only
+# runs while entries are waiting
+LOG_DRAIN_INTERVAL_MS = 100
+LOG_DRAIN_BATCH_SIZE = 500
+
+# Captured entries waiting for the UI thread; newer ones are dropped beyond it
+LOG_QUEUE_MAX_SIZE = 10000
+
+# Display line: [HH:MM:SS.mmm] LEVEL MODULE - message
+_LINE_FMT = "[%02d:%02d:%02d.%03d] %-8s %-15s - %s"
+
+# Display color per log level
+_LEVEL_COLORS = {
+    'DEBUG': '#808080',     # Gray
+    'INFO': '#000000',      # Black
+    'WARNING': '#ff8c00',   # Orange
+    'ERROR': '#dc143c',     # Crimson
+    'CRITICAL': '#8b0000'   # Dark red
+}
+
+
+@dataclass(slots=True)
+class LogEntry:
+    """A single entry shown in the debug tab"""
+    
+    timestamp: datetime
+    level: str
+    module: str
+    function: str
+    line: int
+    message: str
+    exception: Optional[str] = None
+
+
+_format_exception = logging.Formatter().formatException
+
+
+def _exception_text(record: logging.LogRecord) -> str:
+    """Traceback text of a record, reusing text cached by other handlers"""
+    return record.exc_text or _format_exception(record.exc_info)
+
+
+def _level_filter(level_filter: str) -> Callable[[LogEntry], bool]:
+    """Build the entry predicate for a level filter value"""
+    threshold = _LEVEL_VALUES.get(level_filter, 0)
+    if threshold == 0:
+        return lambda entry: True
+    
+    level_values = _LEVEL_VALUES
+    return lambda entry: level_values.get(entry.level, 0) >= threshold
+
+
+class LogListModel(QAbstractListModel):
+    """List model over the log entries shown in the debug tab
+    
+    Rows are formatted on demand, so only the visible lines are rendered.
+    """
+    
+    # Shared foreground colors per log level, built on first use
+    _level_colors: Dict[str, QColor] = {}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[LogEntry] = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        entry = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            ts = entry.timestamp
+            return _LINE_FMT % (
+                ts.hour, ts.minute, ts.second, ts.microsecond // 1000,
+                entry.level, entry.module, entry.message.replace('\n', ' ')
+            )
+        if role == Qt.ForegroundRole:
+            return self._color_for_level(entry.level)
+        return None
+    
+    @classmethod
+    def _color_for_level(cls, level: str) -> QColor:
+        """Get the shared color for a log level"""
+        color = cls._level_colors.get(level)
+        if color is None:
+            color = cls._level_colors[level] = QColor(_LEVEL_COLORS.get(level, '#000000'))
+        return color
+    
+    def entry_at(self, row: int) -> LogEntry:
+        """Get the entry shown on a row"""
+        return self._entries[row]
+    
+    def append_entries(self, entries: List[LogEntry], max_rows: int):
+        """Append rows, dropping the oldest ones beyond max_rows"""
+        if entries:
+            first = len(self._entries)
+            self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+            self._entries.extend(entries)
+            self.endInsertRows()
+        
+        excess = len(self._entries) - max_rows
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self._entries[:excess]
+            self.endRemoveRows()
+    
+    def set_entries(self, entries: Iterable[LogEntry]):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._entries = list(entries)
+        self.endResetModel()
+
 
 class DebugTab(QWidget):
     """Debug tab for displaying logs and error information"""
     
+    # Emitted from the logging thread when an entry lands in an empty queue
+    _log_queued = Signal()
+    
     def __init__(self):
         super().__init__()
         
-        # Log storage
-        self.log_entries: List[Dict] = []
+        # Log storage (ring buffer: oldest entries drop off automatically)
         self.max_log_entries = 1000
+        self.log_entries: Deque[LogEntry] = deque(maxlen=self.max_log_entries)
         
         # Auto-scroll setting
         self.auto_scroll = True
@@ -34,6 +169,16 @@ class DebugTab(QWidget):
         self._setup_ui()
         self._setup_connections()
         
+        # Predicate for the current level filter
+        self._should_show_entry = _level_filter(self.level_combo.currentData())
+        
+        # Entries waiting to be drawn; flushed in batches at ~30 Hz
+        self._pending: List[LogEntry] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
         # Setup log capture
         self._setup_log_capture()
         
@@ -86,20 +231,19 @@ class DebugTab(QWidget):
         # Main splitter (log area | details area)
         splitter = QSplitter(Qt.Vertical)
         
-        # Log display area
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        # Log display area (one row per entry, colored by level)
+        self._log_model = LogListModel(self)
+        self.log_view = QListView()
+        self.log_view.setModel(self._log_model)
+        self.log_view.setUniformItemSizes(True)
         
         # Use monospace font for better formatting
         font = QFont("Consolas", 9)
         font.setFamily("Monaco")  # macOS
         font.setFamily("DejaVu Sans Mono")  # Linux
-        self.log_text.setFont(font)
-        
-        # Enable rich text for color formatting
-        self.log_text.setAcceptRichText(True)
+        self.log_view.setFont(font)
         
-        splitter.addWidget(self.log_text)
+        splitter.addWidget(self.log_view)
         
         # Details area (for error details, stack traces, etc.)
         self.details_text = QTextEdit()
@@ -132,136 +276,111 @@ class DebugTab(QWidget):
     
     def _setup_connections(self):
         """Setup signal connections"""
-        self.level_combo.currentTextChanged.connect(self._refresh_display)
+        self.level_combo.currentTextChanged.connect(self._on_level_changed)
         self.auto_scroll_check.toggled.connect(self._set_auto_scroll)
         self.clear_button.clicked.connect(self.clear_logs)
         
-        # Text selection in log area shows details
-        self.log_text.selectionChanged.connect(self._show_selection_details)
+        # Selecting a row in log area shows details
+        self.log_view.selectionModel().currentChanged.connect(self._show_selection_details)
     
     def _setup_log_capture(self):
         """Setup log capture from the application logger"""
-        # Create a custom handler to capture logs
-        class DebugTabHandler(logging.Handler):
-            def __init__(self, debug_tab):
-                super().__init__()
-                self.debug_tab = debug_tab
+        # Create a custom handler to capture logs. Logging may happen on any
+        # thread, so emit() only snapshots the record into a LogEntry (no
+        # widget access) and queues it; _drain_log_queue displays it on the
+        # UI thread
+        notify_queued = self._log_queued.emit
+        
+        class DebugTabHandler(logging.handlers.QueueHandler):
+            def prepare(self, record):
+                # Message and traceback are rendered here, so neither the
+                # args nor exc_info (and the frames it holds) are queued
+                return LogEntry(
+                    timestamp=datetime.fromtimestamp(record.created),
+                    # Not record.levelname: the console formatter colors it in place
+                    level=logging.getLevelName(record.levelno),
+                    module=record.module,
+                    function=record.funcName,
+                    line=record.lineno,
+                    message=record.getMessage(),
+                    exception=_exception_text(record) if record.exc_info else None
+                )
             
-            def emit(self, record):
+            def enqueue(self, entry):
                 try:
-                    # Format the log record
-                    log_entry = {
-                        'timestamp': datetime.fromtimestamp(record.created),
-                        'level': record.levelname,
-                        'module': record.module,
-                        'function': record.funcName,
-                        'line': record.lineno,
-                        'message': record.getMessage(),
-                        'exception': self.format(record) if record.exc_info else None
-                    }
-                    self.debug_tab._add_log_entry(log_entry)
-                except Exception:
-                    pass  # Avoid infinite recursion if logging fails
+                    self.queue.put_nowait(entry)
+                except queue.Full:
+                    return  # UI thread is behind; drop rather than grow unbounded
+                if self.queue.qsize() == 1:
+                    # First waiting entry: have the UI thread start draining
+                    notify_queued()
+        
+        self._log_queue = queue.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
         
         # Add our handler to the application logger
-        self.log_handler = DebugTabHandler(self)
+        self.log_handler = DebugTabHandler(self._log_queue)
         logger.get_logger().addHandler(self.log_handler)
+        
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setInterval(LOG_DRAIN_INTERVAL_MS)
+        self._drain_timer.timeout.connect(self._drain_log_queue)
+        self._log_queued.connect(self._start_draining, Qt.QueuedConnection)
+    
+    def _start_draining(self):
+        """Start the drain timer unless it is already running"""
+        if not self._drain_timer.isActive():
+            self._drain_timer.start()
+    
+    def _drain_log_queue(self):
+        """Display queued log entries (runs on the UI thread)"""
+        for _ in range(LOG_DRAIN_BATCH_SIZE):
+            try:
+                log_entry = self._log_queue.get_nowait()
+            except queue.Empty:
+                # Idle until the handler queues the next entry
+                self._drain_timer.stop()
+                break
+            self._add_log_entry(log_entry)
     
-    def _add_log_entry(self, entry: Dict):
+    def _add_log_entry(self, entry: LogEntry):
         """Add a log entry to the display"""
         # Add to storage
         self.log_entries.append(entry)
         
-        # Limit storage size
-        if len(self.log_entries) > self.max_log_entries:
-            self.log_entries = self.log_entries[-self.max_log_entries:]
-        
-        # Update display if entry matches current filter
-        current_filter = self.level_combo.currentData()
-        if self._should_show_entry(entry, current_filter):
-            self._append_entry_to_display(entry)
-        
-        # Update status
-        self._update_status()
+        # Queue for display if entry matches current filter; the flush timer
+        # writes queued entries and refreshes the status in one pass
+        if self._should_show_entry(entry):
+            self._pending.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
     
-    def _should_show_entry(self, entry: Dict, level_filter: str) -> bool:
-        """Check if entry should be shown based on current filter"""
-        if level_filter == "ALL":
-            return True
-        
-        # Map log levels to numeric values for comparison
-        level_values = {
-            "DEBUG": 10,
-            "INFO": 20,
-            "WARNING": 30,
-            "ERROR": 40,
-            "CRITICAL": 50
-        }
-        
-        entry_level = level_values.get(entry['level'], 0)
-        filter_level = level_values.get(level_filter, 0)
-        
-        return entry_level >= filter_level
-    
-    def _append_entry_to_display(self, entry: Dict):
-        """Append a single entry to the display"""
-        # Format timestamp
-        timestamp = entry['timestamp'].strftime('%H:%M:%S.%f')[:-3]
-        
-        # Create formatted line
-        level = entry['level']
-        module = entry['module']
-        message = entry['message']
-        
-        # Color based on log level
-        colors = {
-            'DEBUG': '#808080',     # Gray
-            'INFO': '#000000',      # Black
-            'WARNING': '#ff8c00',   # Orange
-            'ERROR': '#dc143c',     # Crimson
-            'CRITICAL': '#8b0000'   # Dark red
-        }
-        
-        color = colors.get(level, '#000000')
-        
-        # Format the line
-        formatted_line = f"[{timestamp}] {level:<8} {module:<15} - {message}"
-        
-        # Append to text widget with color
-        cursor = self.log_text.textCursor()
-        # Use proper enum for QTextCursor move operation (compatible with newer PySide6)
-        try:
-            # Try new PySide6 style first
-            cursor.movePosition(QTextCursor.MoveOperation.End)
-        except AttributeError:
-            # Fallback to older style
-            cursor.movePosition(QTextCursor.End)
-        
-        # Set color format
-        format = QTextCharFormat()
-        format.setForeground(QColor(color))
-        cursor.setCharFormat(format)
-        
-        # Insert text
-        cursor.insertText(formatted_line + "\\n")
+    def _flush_pending(self):
+        """Write queued log entries to the display"""
+        pending, self._pending = self._pending, []
+        self._log_model.append_entries(pending, self.max_log_entries)
         
         # Auto-scroll if enabled
         if self.auto_scroll:
-            scrollbar = self.log_text.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+            self.log_view.scrollToBottom()
+        
+        self._update_status()
+    
+    def _on_level_changed(self):
+        """Rebuild the filter predicate and redraw"""
+        self._should_show_entry = _level_filter(self.level_combo.currentData())
+        self._refresh_display()
     
     def _refresh_display(self):
         """Refresh the entire display based on current filter"""
-        # Clear current display
-        self.log_text.clear()
+        # Queued entries are redrawn from storage
+        self._pending.clear()
         
-        # Get current filter
-        current_filter = self.level_combo.currentData()
-        
-        # Add all entries that match the filter
-        for entry in self.log_entries:
-            if self._should_show_entry(entry, current_filter):
-                self._append_entry_to_display(entry)
+        # Show all entries that match the filter
+        self._log_model.set_entries(
+            entry for entry in self.log_entries if self._should_show_entry(entry)
+        )
+        if self.auto_scroll:
+            self.log_view.scrollToBottom()
         
         self._update_status()
     
@@ -269,41 +388,30 @@ class DebugTab(QWidget):
         """Set auto-scroll setting"""
         self.auto_scroll = enabled
     
-    def _show_selection_details(self):
+    def _show_selection_details(self, current: QModelIndex, previous: QModelIndex):
         """Show details for selected log entry"""
-        cursor = self.log_text.textCursor()
-        if not cursor.hasSelection():
+        if not current.isValid():
             self.details_text.clear()
             return
         
-        # Get selected line(s)
-        selected_text = cursor.selectedText()
-        
-        # Try to find corresponding log entry
-        # This is a simple implementation - could be improved
-        for entry in reversed(self.log_entries):  # Check recent entries first
-            if entry['message'] in selected_text:
-                details = self._format_entry_details(entry)
-                self.details_text.setPlainText(details)
-                break
-        else:
-            self.details_text.setPlainText("選択されたログエントリの詳細が見つかりません")
+        details = self._format_entry_details(self._log_model.entry_at(current.row()))
+        self.details_text.setPlainText(details)
     
-    def _format_entry_details(self, entry: Dict) -> str:
+    def _format_entry_details(self, entry: LogEntry) -> str:
         """Format detailed information for a log entry"""
         details = []
-        details.append(f"タイムスタンプ: {entry['timestamp'].strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}")
-        details.append(f"レベル: {entry['level']}")
-        details.append(f"モジュール: {entry['module']}")
-        details.append(f"関数: {entry['function']}")
-        details.append(f"行番号: {entry['line']}")
-        details.append(f"メッセージ: {entry['message']}")
-        
-        if entry.get('exception'):
-            details.append("\\n例外情報:")
-            details.append(entry['exception'])
-        
-        return "\\n".join(details)
+        details.append(f"タイムスタンプ: {entry.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}")
+        details.append(f"レベル: {entry.level}")
+        details.append(f"モジュール: {entry.module}")
+        details.append(f"関数: {entry.function}")
+        details.append(f"行番号: {entry.line}")
+        details.append(f"メッセージ: {entry.message}")
+        
+        if entry.exception:
+            details.append("\n例外情報:")
+            details.append(entry.exception)
+        
+        return "\n".join(details)
     
     def _update_status(self):
         """Update status information"""
@@ -320,81 +428,83 @@ class DebugTab(QWidget):
     # Public methods for adding different types of logs
     def add_debug(self, message: str):
         """Add debug message"""
-        entry = {
-            'timestamp': datetime.now(),
-            'level': 'DEBUG',
-            'module': 'debug_tab',
-            'function': 'add_debug',
-            'line': 0,
-            'message': message,
-            'exception': None
-        }
+        entry = LogEntry(
+            timestamp=datetime.now(),
+            level='DEBUG',
+            module='debug_tab',
+            function='add_debug',
+            line=0,
+            message=message,
+            exception=None
+        )
         self._add_log_entry(entry)
     
     def add_info(self, message: str):
         """Add info message"""
-        entry = {
-            'timestamp': datetime.now(),
-            'level': 'INFO',
-            'module': 'debug_tab',
-            'function': 'add_info',
-            'line': 0,
-            'message': message,
-            'exception': None
-        }
+        entry = LogEntry(
+            timestamp=datetime.now(),
+            level='INFO',
+            module='debug_tab',
+            function='add_info',
+            line=0,
+            message=message,
+            exception=None
+        )
         self._add_log_entry(entry)
     
     def add_warning(self, message: str):
         """Add warning message"""
-        entry = {
-            'timestamp': datetime.now(),
-            'level': 'WARNING',
-            'module': 'debug_tab',
-            'function': 'add_warning',
-            'line': 0,
-            'message': message,
-            'exception': None
-        }
+        entry = LogEntry(
+            timestamp=datetime.now(),
+            level='WARNING',
+            module='debug_tab',
+            function='add_warning',
+            line=0,
+            message=message,
+            exception=None
+        )
         self._add_log_entry(entry)
     
     def add_error(self, message: str, exception_info: str = None):
         """Add error message"""
-        entry = {
-            'timestamp': datetime.now(),
-            'level': 'ERROR',
-            'module': 'debug_tab',
-            'function': 'add_error',
-            'line': 0,
-            'message': message,
-            'exception': exception_info
-        }
+        entry = LogEntry(
+            timestamp=datetime.now(),
+            level='ERROR',
+            module='debug_tab',
+            function='add_error',
+            line=0,
+            message=message,
+            exception=exception_info
+        )
         self._add_log_entry(entry)
     
     def clear_logs(self):
         """Clear all logs"""
         self.log_entries.clear()
-        self.log_text.clear()
+        self._pending.clear()
+        self._log_model.set_entries(())
         self.details_text.clear()
         self._update_status()
         self.add_info("ログがクリアされました")
     
+    def _iter_export_lines(self) -> Iterator[str]:
+        """Yield one export text chunk per stored log entry"""
+        for entry in self.log_entries:
+            timestamp = entry.timestamp.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+            exception = f"Exception: {entry.exception}\n" if entry.exception else ""
+            yield f"[{timestamp}] {entry.level:<8} {entry.module:<15} - {entry.message}\n{exception}\n"
+    
     def export_logs(self, file_path: str):
         """Export logs to file"""
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(f"D3-Mind-Flow-Editor Debug Log\\n")
-                f.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\\n")
-                f.write("=" * 50 + "\\n\\n")
+                f.write("D3-Mind-Flow-Editor Debug Log\n")
+                f.write(f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write("=" * 50 + "\n\n")
                 
-                for entry in self.log_entries:
-                    timestamp = entry['timestamp'].strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-                    f.write(f"[{timestamp}] {entry['level']:<8} {entry['module']:<15} - {entry['message']}\\n")
-                    
-                    if entry.get('exception'):
-                        f.write(f"Exception: {entry['exception']}\\n")
-                    f.write("\\n")
+                f.writelines(self._iter_export_lines())
             
             self.add_info(f"ログを {file_path} にエクスポートしました")
             
         except Exception as e:
-            self.add_error(f"ログのエクスポートに失敗しました: {e}")
\ No newline at end of file
+            self.add_error(f"ログのエクスポートに失敗しました: {e}")
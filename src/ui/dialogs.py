@@ -3,6 +3,8 @@
 Dialog windows for D3-Mind-Flow-Editor
 """
 
+import os
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QLineEdit, QTextEdit, QPushButton, QComboBox,
@@ -14,6 +16,10 @@ from PySide6.QtGui import QFont
 
 from ..utils.logger import logger
 
+# Skip per-entry custom icon probes and symlink resolution when listing
+# directories (slow on network mounts and large folders)
+SAVE_FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+
 
 class SaveDialog(QDialog):
     """Dialog for saving diagram with title and description"""
@@ -93,6 +99,16 @@ class SaveDialog(QDialog):
 class ExportDialog(QDialog):
     """Dialog for export settings"""
     
+    # File extension per export format
+    _EXTENSIONS = {
+        "html": ".html",
+        "png": ".png",
+        "webp": ".webp",
+        "svg": ".svg",
+        "pdf": ".pdf"
+    }
+    _KNOWN_EXTS = frozenset(_EXTENSIONS.values())
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("エクスポート設定")
@@ -139,6 +155,12 @@ class ExportDialog(QDialog):
         self.format_group.addButton(self.pdf_radio, 3)
         format_layout.addWidget(self.pdf_radio)
         
+        # WebP format
+        self.webp_radio = QRadioButton("WebP (軽量画像)")
+        self.webp_radio.setToolTip("PNGより小さい画像ファイルとして出力")
+        self.format_group.addButton(self.webp_radio, 4)
+        format_layout.addWidget(self.webp_radio)
+        
         layout.addWidget(format_group)
         
         # Quality settings group
@@ -225,15 +247,15 @@ class ExportDialog(QDialog):
         format_id = self.format_group.id(checked_button)
         
         # Update format mapping
-        format_map = {0: "html", 1: "png", 2: "svg", 3: "pdf"}
+        format_map = {0: "html", 1: "png", 2: "svg", 3: "pdf", 4: "webp"}
         self.selected_format = format_map.get(format_id, "html")
         
         # Enable/disable quality settings based on format
-        is_raster = format_id == 1  # PNG
+        is_raster = format_id in [1, 4]  # PNG, WebP
         self.dpi_combo.setEnabled(is_raster)
-        self.width_spin.setEnabled(format_id in [1, 2])  # PNG, SVG
-        self.height_spin.setEnabled(format_id in [1, 2])  # PNG, SVG
-        self.transparent_check.setEnabled(format_id in [1, 2])  # PNG, SVG
+        self.width_spin.setEnabled(format_id in [1, 2, 4])  # PNG, SVG, WebP
+        self.height_spin.setEnabled(format_id in [1, 2, 4])  # PNG, SVG, WebP
+        self.transparent_check.setEnabled(format_id in [1, 2, 4])  # PNG, SVG, WebP
         
         # Update file extension in path
         self._update_file_extension()
@@ -241,23 +263,13 @@ class ExportDialog(QDialog):
     def _update_file_extension(self):
         """Update file extension based on selected format"""
         current_path = self.path_edit.text()
-        
-        extensions = {
-            "html": ".html",
-            "png": ".png",
-            "svg": ".svg",
-            "pdf": ".pdf"
-        }
-        
-        new_extension = extensions.get(self.selected_format, ".html")
+        new_extension = self._EXTENSIONS.get(self.selected_format, ".html")
         
         if current_path:
-            # Remove old extension and add new one
-            base_path = current_path
-            for ext in extensions.values():
-                if base_path.endswith(ext):
-                    base_path = base_path[:-len(ext)]
-                    break
+            # Remove old extension (if it is one of ours) and add new one
+            base_path, ext = os.path.splitext(current_path)
+            if ext.lower() not in self._KNOWN_EXTS:
+                base_path = current_path
             
             new_path = base_path + new_extension
             self.path_edit.setText(new_path)
@@ -267,6 +279,7 @@ class ExportDialog(QDialog):
         format_filters = {
             "html": "HTML Files (*.html)",
             "png": "PNG Images (*.png)",
+            "webp": "WebP Images (*.webp)",
             "svg": "SVG Images (*.svg)",
             "pdf": "PDF Documents (*.pdf)"
         }
@@ -276,7 +289,9 @@ class ExportDialog(QDialog):
         file_path, _ = QFileDialog.getSaveFileName(
             self, f"{self.selected_format.upper()}ファイルを保存",
             self.path_edit.text(),
-            filter_str
+            filter_str,
+            "",
+            SAVE_FILE_DIALOG_OPTIONS
         )
         
         if file_path:
@@ -351,7 +366,7 @@ class AboutDialog(QDialog):
         <ul>
         <li>Python 3.10+ / PySide6</li>
         <li>D3.js v7 / SQLite3</li>
-        <li>Playwright / Pillow</li>
+        <li>Playwright</li>
         </ul>
         """)
         description.setWordWrap(True)
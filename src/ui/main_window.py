@@ -77,7 +77,7 @@ class MainWindow(QMainWindow):
         
         # Initialize export manager
         try:
-            self.export_manager = ExportManager()
+            self.export_manager = ExportManager(self.config, self.resolution_manager)
             logger.info("Export manager initialized")
         except Exception as e:
             logger.warning(f"Export manager initialization failed: {e}")
@@ -272,6 +272,10 @@ class MainWindow(QMainWindow):
         export_png_action.triggered.connect(lambda: self._export_diagram("png"))
         export_menu.addAction(export_png_action)
         
+        export_webp_action = QAction("WebP", self)
+        export_webp_action.triggered.connect(lambda: self._export_diagram("webp"))
+        export_menu.addAction(export_webp_action)
+        
         export_svg_action = QAction("SVG", self)
         export_svg_action.triggered.connect(lambda: self._export_diagram("svg"))
         export_menu.addAction(export_svg_action)
@@ -480,11 +484,11 @@ class MainWindow(QMainWindow):
         diagram_type = self.input_panel.get_diagram_type()
         
         try:
-            # Import export manager
-            from ..core.export_manager import ExportManager
-            
-            # Create export manager
-            export_manager = ExportManager(self.config, self.resolution_manager)
+            # Reuse the window's export manager so its browser stays warm
+            export_manager = self.export_manager
+            if export_manager is None:
+                export_manager = ExportManager(self.config, self.resolution_manager)
+                self.export_manager = export_manager
             
             # Show file dialog
             from PySide6.QtWidgets import QFileDialog
@@ -493,6 +497,7 @@ class MainWindow(QMainWindow):
             extensions = {
                 'html': 'HTML Files (*.html)',
                 'png': 'PNG Images (*.png)', 
+                'webp': 'WebP Images (*.webp)',
                 'svg': 'SVG Files (*.svg)',
                 'pdf': 'PDF Files (*.pdf)'
             }
@@ -518,14 +523,7 @@ class MainWindow(QMainWindow):
             QApplication.processEvents()
             
             # Export using async function (we'll make it sync for now)
-            import asyncio
-            
-            # Create new event loop if one doesn't exist
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            loop = self._get_event_loop()
             
             # Export diagram
             success = loop.run_until_complete(
@@ -546,6 +544,18 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "エラー", f"エクスポート中にエラーが発生しました:\n{str(e)}")
             logger.error(f"Export error: {e}", exc_info=True)
     
+    def _get_event_loop(self):
+        """Get the event loop used to drive async exports"""
+        import asyncio
+        
+        # Create new event loop if one doesn't exist
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        return loop
+    
     def _show_export_dialog(self):
         """Show export dialog"""
         dialog = ExportDialog(self)
@@ -692,5 +702,15 @@ class MainWindow(QMainWindow):
         
         self.config.save()
         
+        # Shut down the export browser, if one was started
+        if self.export_manager is not None:
+            try:
+                self._get_event_loop().run_until_complete(self.export_manager.close())
+            except Exception as e:
+                logger.warning(f"Export manager shutdown failed: {e}")
+        
+        if self.db_manager is not None:
+            self.db_manager.close()
+        
         logger.info("Application closing")
         event.accept()
\ No newline at end of file
@@ -24,7 +24,10 @@ class Config:
             "png_height": 1080,
             "png_keep_aspect": True,
             "pdf_vector": True,
-            "pdf_paper_size": "A4"
+            "pdf_cairosvg": False,
+            "pdf_paper_size": "A4",
+            "webp_quality": 90,
+            "page_pool_size": 4
         },
         "ui": {
             "window_width": 1200,
@@ -59,6 +62,7 @@ class Config:
             self.config_path = Path(config_path)
         
         self._config = self.DEFAULT_CONFIG.copy()
+        self._revision = 0
         self.load()
     
     def load(self):
@@ -68,6 +72,7 @@ class Config:
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     user_config = json.load(f)
                     self._merge_config(self._config, user_config)
+                    self._revision += 1
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load config from {self.config_path}: {e}")
             print("Using default configuration")
@@ -119,10 +124,17 @@ class Config:
         
         # Set the final value
         target[keys[-1]] = value
+        self._revision += 1
     
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
         self._config = self.DEFAULT_CONFIG.copy()
+        self._revision += 1
+    
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every change, for callers caching derived values"""
+        return self._revision
     
     def get_all(self) -> Dict[str, Any]:
         """Get all configuration as dictionary"""
@@ -144,6 +144,34 @@ def test_mermaid_parsing():
         assert "edges" in parsed_data
         print("✅ Mermaid parsing works")
         
+        def edge_tuples(code):
+            edges = MermaidParser.parse_mermaid("flowchart TD\n    " + code)["edges"]
+            return [(e["source"], e["target"], e["text"], e["style"]["type"]) for e in edges]
+        
+        # Dotted arrows are not mistaken for a dotted line plus '>'
+        assert edge_tuples("A -.-> B") == [("A", "B", None, "dotted_arrow")]
+        assert edge_tuples("A -.- B") == [("A", "B", None, "dotted")]
+        
+        # Chained edges yield one edge per arrow, keeping types and labels
+        assert edge_tuples("A --- B --> C") == [
+            ("A", "B", None, "line"), ("B", "C", None, "arrow")
+        ]
+        assert edge_tuples("A --> B -->|x| C") == [
+            ("A", "B", None, "arrow"), ("B", "C", "x", "arrow")
+        ]
+        print("✅ Mermaid arrow types and chained edges work")
+        
+        # Module-level parse_mermaid, imported by the D3 generator and the
+        # preview panel
+        from src.core.mermaid_parser import parse_mermaid
+        module_data = parse_mermaid(mermaid_code)
+        assert module_data == parsed_data
+        
+        # Each call gets its own copy of the memoized result
+        module_data["nodes"].clear()
+        assert parse_mermaid(mermaid_code) == parsed_data
+        print("✅ Module-level parse_mermaid works")
+        
         return True
         
     except Exception as e:
@@ -181,6 +209,58 @@ def test_database():
         assert len(diagrams) >= 1
         print("✅ Database load works")
         
+        # Test search: 3+ characters use the full-text index when available,
+        # shorter queries fall back to LIKE
+        other = Diagram()
+        other.title = "プロジェクト計画"
+        other.diagram_type = DiagramType.GANTT
+        other.mermaid_data = "gantt content"
+        other.description = "開発スケジュール"
+        other_id = db_manager.save_diagram(other)
+        
+        def search_ids(query):
+            return {d.id for d in db_manager.search_diagrams(query)}
+        
+        assert search_ids("ジェクト") == {other_id}
+        assert search_ids("スケジュール") == {other_id}
+        assert search_ids("テスト") == {saved_diagram_id}
+        assert search_ids("計画") == {other_id}
+        assert search_ids("説") == {saved_diagram_id}
+        print(f"✅ Database search works (full-text index: {db_manager._fts_available})")
+        
+        # Test that the search index follows updates and deletes
+        other.id = other_id
+        other.title = "リリース手順"
+        db_manager.save_diagram(other)
+        assert search_ids("ジェクト") == set()
+        assert search_ids("リリース") == {other_id}
+        
+        db_manager.delete_diagram(other_id)
+        assert search_ids("リリース") == set()
+        assert search_ids("スケジュール") == set()
+        print("✅ Database search follows updates and deletes")
+        
+        # Test batch save: IDs come back in input order for mixed
+        # inserts and updates
+        existing = db_manager.get_diagram(saved_diagram_id)
+        existing.title = "更新済みダイアグラム"
+        batch = []
+        for i in range(3):
+            new_diagram = Diagram()
+            new_diagram.title = f"バッチ{i}"
+            new_diagram.diagram_type = DiagramType.FLOWCHART
+            new_diagram.mermaid_data = f"flowchart {i}"
+            new_diagram.description = ""
+            batch.append(new_diagram)
+        batch.insert(1, existing)
+        
+        batch_ids = db_manager.save_many(batch)
+        assert len(batch_ids) == len(batch)
+        assert batch_ids[1] == saved_diagram_id
+        for diagram_id, diagram in zip(batch_ids, batch):
+            assert db_manager.get_diagram(diagram_id).title == diagram.title
+        print("✅ Database batch save works")
+        
         return True
         
     except Exception as e:
@@ -272,6 +352,144 @@ def test_d3_templates():
         print(f"❌ D3 template error: {e}")
         return False
 
+def test_png_dpi_metadata():
+    """Test PNG DPI metadata (pHYs chunk) splicing"""
+    print("\n🔍 Testing PNG DPI metadata...")
+    
+    try:
+        import struct
+        import zlib
+        from src.core.export_manager import ExportManager
+        
+        def make_chunk(chunk_type, data):
+            return (struct.pack('>I', len(data)) + chunk_type + data +
+                    struct.pack('>I', zlib.crc32(chunk_type + data)))
+        
+        def read_chunks(png_bytes):
+            """Split PNG data into (type, data) pairs, checking every CRC"""
+            chunks = []
+            pos = 8
+            while pos < len(png_bytes):
+                length, = struct.unpack_from('>I', png_bytes, pos)
+                chunk_type = png_bytes[pos + 4:pos + 8]
+                data = png_bytes[pos + 8:pos + 8 + length]
+                crc, = struct.unpack_from('>I', png_bytes, pos + 8 + length)
+                assert crc == zlib.crc32(chunk_type + data), f"Bad CRC in {chunk_type}"
+                chunks.append((chunk_type, data))
+                pos += 12 + length
+            return chunks
+        
+        signature = b'\x89PNG\r\n\x1a\n'
+        ihdr = make_chunk(b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0))
+        idat = make_chunk(b'IDAT', zlib.compress(b'\x00\x00\x00\x00'))
+        iend = make_chunk(b'IEND', b'')
+        png_bytes = signature + ihdr + idat + iend
+        
+        # 300 DPI = 11811 pixels per metre, unit specifier 1 (metre)
+        phys_300 = struct.pack('>IIB', 11811, 11811, 1)
+        
+        # _set_png_dpi only needs the class, not a configured instance
+        export_manager = ExportManager.__new__(ExportManager)
+        
+        # pHYs is inserted right after IHDR
+        chunks = read_chunks(export_manager._set_png_dpi(png_bytes, 300))
+        assert [t for t, _ in chunks] == [b'IHDR', b'pHYs', b'IDAT', b'IEND']
+        assert chunks[1][1] == phys_300
+        print("✅ pHYs chunk inserted after IHDR")
+        
+        # An existing pHYs chunk is replaced, not duplicated
+        old_phys = make_chunk(b'pHYs', struct.pack('>IIB', 2835, 2835, 1))
+        chunks = read_chunks(export_manager._set_png_dpi(
+            signature + ihdr + old_phys + idat + iend, 300))
+        assert [t for t, _ in chunks] == [b'IHDR', b'pHYs', b'IDAT', b'IEND']
+        assert chunks[1][1] == phys_300
+        print("✅ Existing pHYs chunk replaced")
+        
+        # Non-PNG and truncated input comes back unchanged
+        for data in (b'GIF89a not a png', png_bytes[:-6], png_bytes[:10]):
+            assert export_manager._set_png_dpi(data, 300) == data
+        print("✅ Invalid PNG data left unchanged")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ PNG DPI metadata error: {e}")
+        return False
+
+def test_export_page_pool_concurrency():
+    """Test that concurrent page rentals share one export page pool"""
+    print("\n🔍 Testing export page pool concurrency...")
+    
+    try:
+        import tempfile
+        from src.core.export_manager import ExportManager
+        from src.utils.config import Config
+        
+        # Minimal stand-ins for Playwright objects; each await yields to the
+        # event loop so the two rentals interleave
+        class FakeContext:
+            async def close(self):
+                await asyncio.sleep(0)
+        
+        class FakePage:
+            def __init__(self):
+                self.context = FakeContext()
+            
+            def is_closed(self):
+                return False
+            
+            async def goto(self, url):
+                await asyncio.sleep(0)
+        
+        class FakeBrowser:
+            def is_connected(self):
+                return True
+            
+            async def new_page(self, **kwargs):
+                await asyncio.sleep(0)
+                return FakePage()
+            
+            async def close(self):
+                pass
+        
+        async def rent_concurrently():
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                config = Config(os.path.join(tmp_dir, "config.json"))
+                export_manager = ExportManager(config, None)
+                export_manager._browser = FakeBrowser()
+                
+                # A pool for outdated settings, whose idle page takes an
+                # await to close when the new pool replaces it
+                stale_pool = asyncio.Queue()
+                stale_pool.put_nowait(FakePage())
+                export_manager._page_pools[("mindmap", 1, 1, 1.0)] = stale_pool
+                export_manager._page_counts[stale_pool] = 1
+                
+                rentals = await asyncio.gather(
+                    export_manager._acquire_page("mindmap"),
+                    export_manager._acquire_page("mindmap")
+                )
+                (pool_a, page_a), (pool_b, page_b) = rentals
+                assert pool_a is pool_b, "Concurrent rentals created separate pools"
+                assert list(export_manager._page_pools.values()) == [pool_a]
+                assert export_manager._page_counts == {pool_a: 2}
+                
+                await export_manager._release_page(pool_a, page_a)
+                await export_manager._release_page(pool_b, page_b)
+                assert pool_a.qsize() == 2
+                
+                await export_manager.close()
+                assert not export_manager._page_pools
+        
+        asyncio.run(rent_concurrently())
+        print("✅ Concurrent page rentals share one pool")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Export page pool error: {e}")
+        return False
+
 async def test_export_functionality():
     """Test export functionality (async)"""
     print("\n🔍 Testing export functionality...")
@@ -332,6 +550,8 @@ def main():
         ("Configuration", test_configuration),
         ("AI Prompts", test_ai_prompts),
         ("D3.js Templates", test_d3_templates),
+        ("PNG DPI Metadata", test_png_dpi_metadata),
+        ("Export Page Pool", test_export_page_pool_concurrency),
         ("Export Functionality", lambda: asyncio.run(test_export_functionality())),
     ]
     